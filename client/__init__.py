@@ -6,7 +6,28 @@ AIClient for interacting with AI providers, GitConfig for
 managing configurations, and DocGenerator for generating documentation.
 """
 
-from .client import AIClient
-from .gitwrapper import GitWrapper
-from .gitconfig import GitConfig
-from .doc import DocGenerator
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562), so code that
+# only needs one class does not pay for the dependencies of the others.
+_exports = {
+    'AIClient':      '.client',
+    'close_session': '.client',
+    'GitWrapper':    '.gitwrapper',
+    'GitConfig':     '.gitconfig',
+    'DocGenerator':  '.doc',
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    if name in _exports:
+        value = getattr(importlib.import_module(_exports[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,16 +6,163 @@ The AIClient class allows users to configure and use different AI providers
 selection, configuration management, and API interactions.
 """
 
-from InquirerPy import inquirer
-from rich.console import Console
-from typing import Optional, Dict
+from collections.abc import Mapping
+from typing import Optional, Dict, List
+import ast
+import asyncio
+import json
 import re
-import requests
 import sys
+from .console import get_console
 from .gitconfig import GitConfig
-from .gitwrapper import GitWrapper
 
-console = Console()
+_session = None
+
+
+def _get_session():
+    """
+    Return the HTTP session shared by all AIClient instances.
+
+    The session is created (and requests imported) on the first prompt. It
+    keeps connections alive between prompts and across clients, so only the
+    first request to each provider host pays for DNS, TCP and TLS setup.
+    Only failures where the provider cannot have run the prompt are retried
+    with backoff: connection errors and 429 rate limits. Read timeouts and 5xx
+    errors are not, since repeating a billed generation could run it twice.
+    A final 429 is returned as is, so raise_for_status() still raises HTTPError.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(total=3, connect=3, read=0, other=0, status=3, status_forcelist=[429],
+                      allowed_methods=frozenset({'POST'}), backoff_factor=0.3, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+        session = requests.Session()
+        session.headers.update({'Connection': 'keep-alive'})
+        session.mount("https://", adapter)
+        _session = session
+    return _session
+
+
+def close_session():
+    """
+    Close the HTTP session shared by all AIClient instances.
+
+    This releases the pooled connections of every client in the process, not
+    just one; a new session is created automatically by the next prompt.
+    """
+    global _session
+    if _session is not None:
+        _session.close()
+        _session = None
+
+
+# Key/value pairs in a provider header template, e.g. {x-api-key: {api_key}, anthropic-version: 2023-06-01}
+_HEADERS_KV_RE = re.compile(r'([\w-]+):\s*([^,}]+)')
+# The API key placeholder; the closing brace may have been eaten by _HEADERS_KV_RE
+_APIKEY_RE = re.compile(r'\{api_key\}?')
+
+
+class _ProviderNames(Mapping):
+    """
+    A read-only mapping of provider keys to friendly names, fetched on demand.
+
+    Each friendly name is looked up in the configuration only when it is first
+    accessed, so resolving a single default provider does not read the names
+    of all other providers.
+    """
+
+    def __init__(self, config_provider, providers):
+        self._config_provider = config_provider
+        self._providers = list(providers)
+        self._names = {}
+
+    def __getitem__(self, provider):
+        if provider not in self._names:
+            if provider not in self._providers:
+                raise KeyError(provider)
+            self._names[provider] = self._config_provider.get_metadata(f"{provider}.name")
+        return self._names[provider]
+
+    def __contains__(self, provider):
+        return provider in self._providers
+
+    def __iter__(self):
+        return iter(self._providers)
+
+    def __len__(self):
+        return len(self._providers)
+
+
+class _LazyDict(Mapping):
+    """
+    A read-only mapping that is built by a factory on first access.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._data = None
+
+    def _materialize(self):
+        if self._data is None:
+            self._data = self._factory()
+        return self._data
+
+    def __getitem__(self, key):
+        return self._materialize()[key]
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __len__(self):
+        return len(self._materialize())
+
+
+def _compile_response_template(template: str):
+    """
+    Compile a response template into a callable that extracts the answer.
+
+    Templates of the common form ``response.json()['a'][0]['b']`` are reduced
+    to a tuple of keys that is walked directly; anything else is compiled once
+    and evaluated with this module's globals, as the template always was.
+
+    Args:
+        template (str): The response template, an expression over ``response``.
+
+    Returns:
+        Callable[[requests.Response], Any]: The extractor for the template.
+    """
+    code = compile(template, '<response>', 'eval')
+
+    keys = []
+    node = ast.parse(template, mode='eval').body
+    while isinstance(node, ast.Subscript) and isinstance(node.slice, ast.Constant):
+        keys.append(node.slice.value)
+        node = node.value
+
+    is_json_call = (isinstance(node, ast.Call) and not node.args and not node.keywords
+                    and isinstance(node.func, ast.Attribute) and node.func.attr == 'json'
+                    and isinstance(node.func.value, ast.Name) and node.func.value.id == 'response')
+
+    if is_json_call:
+        keys = tuple(reversed(keys))
+
+        def extract(response):
+            value = response.json()
+            for key in keys:
+                value = value[key]
+            return value
+
+        return extract
+
+    return lambda response: eval(code, globals(), {'response': response})
+
 
 class AIClient:
     """
@@ -47,22 +194,24 @@ class AIClient:
             config_provider (GitConfig): The configuration provider to use for storing/retrieving settings.
         """
         self.config_provider = config_provider or GitConfig()
+        self._git = None
         self.available_providers = self.config_provider.get_available_providers()
 
         if not self.available_providers:
-            console.print("[yellow]No AI providers found in git config. Let's create one.[/yellow]")
+            get_console().print("[yellow]No AI providers found in git config. Let's create one.[/yellow]")
             self.create_new_provider()
             return
 
-        self.provider_names = {p: self.config_provider.get_metadata(f"{p}.name") for p in self.available_providers}
-        self.name_to_provider = {v: k for k, v in self.provider_names.items()}
+        # Friendly names are only resolved when the selection UI or a lookup by name needs them
+        self.provider_names = _ProviderNames(self.config_provider, self.available_providers)
+        self.name_to_provider = _LazyDict(lambda: {v: k for k, v in self.provider_names.items()})
 
         if ai is None:
             ai = self.config_provider.get_default_provider()
 
         if ai is None or (ai not in self.available_providers and ai not in self.name_to_provider):
             if ai:
-                console.print(f"[yellow]Provider '{ai}' not found in git config.[/yellow]")
+                get_console().print(f"[yellow]Provider '{ai}' not found in git config.[/yellow]")
 
             selected_name = self.config_provider.select_provider(
                 message="Select an AI provider or set a default:",
@@ -103,12 +252,19 @@ class AIClient:
         self.model = metadata.get('model', '')
         self.header_template = metadata.get('header', '')
         self.response_template = metadata.get('response', '')
+        self._extract_response = _compile_response_template(self.response_template) if self.response_template else None
+
+        # The header template and API key are fixed per provider, so parse once
+        self._parsed_headers = self.parse_headers(self.header_template)
 
 
     def parse_headers(self, headers_str):
         """
         Parse a header string and format the values with the API key.
 
+        JSON objects such as {"x-api-key": "{api_key}"} are parsed as JSON; the
+        legacy unquoted form {x-api-key: {api_key}} falls back to a regex parse.
+
         Args:
             headers_str (str): A string representation of the headers.
 
@@ -118,11 +274,19 @@ class AIClient:
         if headers_str is None:
             return {}
 
+        # Templates written as proper JSON objects can be parsed directly
+        try:
+            raw = json.loads(headers_str)
+        except json.JSONDecodeError:
+            raw = None
+        if isinstance(raw, dict):
+            return {str(key): str(value).replace('{api_key}', self.api_key) for key, value in raw.items()}
+
         # Remove the outer curly braces
         headers_str = headers_str.strip().strip('{}')
 
         # Use regex to split the string into key-value pairs
-        pairs = re.findall(r'([\w-]+):\s*([^,}]+)', headers_str)
+        pairs = _HEADERS_KV_RE.findall(headers_str)
 
         headers_dict = {}
         for key, value in pairs:
@@ -130,7 +294,7 @@ class AIClient:
             key = key.strip()
             value = value.strip().strip('"')
             # Replace {api_key} with self.api_key, handling cases where the closing brace might be missing
-            value = re.sub(r'\{api_key\}?', self.api_key, value)
+            value = _APIKEY_RE.sub(self.api_key, value)
             headers_dict[key] = value
 
         return headers_dict
@@ -159,9 +323,7 @@ class AIClient:
         if model:
             self.model = model
 
-        api_headers = self.parse_headers(self.header_template)
-
-        headers.update(api_headers)
+        headers.update(self._parsed_headers)
 
         data = {
             "model": self.model,
@@ -172,11 +334,53 @@ class AIClient:
         }
 
         # Make the API request
-        response = requests.post(self.url, headers=headers, json=data)
+        response = _get_session().post(self.url, headers=headers, json=data)
         response.raise_for_status()
 
         # Parse and return the result
-        return eval(self.response_template)
+        if self._extract_response is None:
+            raise ValueError(f"No response template configured for provider '{self.ai}'.")
+        return self._extract_response(response)
+
+    async def aprompt(self, prompt: str, model: Optional[str] = None, tokens: int = 1000):
+        """
+        Send a prompt to the AI provider without blocking the event loop.
+
+        The request runs in a worker thread on the shared pooled session, so
+        several prompts awaited together reuse the open keep-alive connections.
+
+        Args:
+            prompt          (str): The prompt to send to the AI model.
+            model (Optional[str]): The specific model to use. If None, uses the default model.
+            tokens          (int): The maximum number of tokens to generate in the response.
+
+        Returns:
+            str: The generated response from the AI model.
+        """
+        return await asyncio.to_thread(self.prompt, prompt, model, tokens)
+
+
+    def gather_prompts(self, prompts: List[str], model: Optional[str] = None, tokens: int = 1000) -> List[str]:
+        """
+        Send several prompts concurrently and collect their responses.
+
+        Must be called from synchronous code; use aprompt directly when an
+        event loop is already running.
+
+        Args:
+            prompts   (List[str]): The prompts to send to the AI model.
+            model (Optional[str]): The specific model to use. If None, uses the default model.
+            tokens          (int): The maximum number of tokens to generate per response.
+
+        Returns:
+            List[str]: The responses, in the same order as the prompts.
+        """
+        _get_session()  # Create the shared session before the worker threads need it
+
+        async def run_all():
+            return await asyncio.gather(*(self.aprompt(p, model, tokens) for p in prompts))
+
+        return asyncio.run(run_all())
 
     @classmethod
     def set_default_provider(cls, provider: Optional[str] = None):
@@ -187,6 +391,7 @@ class AIClient:
             config.set_default_provider_interactive()
 
     def create_new_provider(self):
+        from InquirerPy import inquirer
         provider_name = inquirer.text(message="Enter a name for the new provider:").execute()
         self.config_provider.create_provider(provider_name)
         self.config_provider.configure_provider(provider_name)
@@ -200,8 +405,7 @@ class AIClient:
             branch  (str): The name of the branch to comment on
             comment (str): The comment to associate with the branch
         """
-        git = GitWrapper()
-        git.set_branch_comment(branch, comment)
+        self._git_wrapper().set_branch_comment(branch, comment)
 
     def get_branch_comment(self, branch: str) -> Optional[str]:
         """Get the comment associated with a specific branch.
@@ -212,8 +416,7 @@ class AIClient:
         Returns:
             Optional[str]: The comment if it exists, None otherwise
         """
-        git = GitWrapper()
-        return git.get_branch_comment(branch)
+        return self._git_wrapper().get_branch_comment(branch)
 
     def get_all_branch_comments(self) -> Dict[str, str]:
         """Get all branch comments.
@@ -221,5 +424,14 @@ class AIClient:
         Returns:
             Dict[str, str]: A dictionary mapping branch names to their comments
         """
-        git = GitWrapper()
-        return git.get_all_branch_comments()
+        return self._git_wrapper().get_all_branch_comments()
+
+    def _git_wrapper(self):
+        """Return the GitWrapper used for branch comments, creating it on first use.
+
+        Reusing one wrapper keeps its config cache warm across comment lookups.
+        """
+        if self._git is None:
+            from .gitwrapper import GitWrapper
+            self._git = GitWrapper()
+        return self._git
@@ -7,12 +7,9 @@ for storing, retrieving, and managing AI provider configurations.
 """
 
 from abc import ABC, abstractmethod
-from InquirerPy import inquirer
-from rich.console import Console
-from rich.table import Table
-from typing import List, Dict, Optional
+from typing import List, Dict
+from .console import get_console
 
-console = Console()
 
 class ConfigProvider(ABC):
     """
@@ -24,7 +21,7 @@ class ConfigProvider(ABC):
     """
 
     @abstractmethod
-    def get_metadata(self, key: str) -> Optional[str]:
+    def get_metadata(self, key: str) -> str:
         """
         Retrieve a metadata value for a given key.
 
@@ -32,7 +29,7 @@ class ConfigProvider(ABC):
             key (str): The key to retrieve.
 
         Returns:
-            Optional[str]: The value associated with the key, or None if not found.
+            str: The value associated with the key, or an empty string if not found.
         """
         pass
 
@@ -128,6 +125,8 @@ class ConfigProvider(ABC):
             title               (str): The title for the configuration display.
             metadata (Dict[str, str]): The configuration metadata to display.
         """
+        from rich.table import Table
+
         table = Table(title=title)
         table.add_column("Key", style="cyan")
         table.add_column("Value", style="magenta")
@@ -138,7 +137,7 @@ class ConfigProvider(ABC):
             else:
                 table.add_row(key, value if value else "[not set]")
 
-        console.print(table)
+        get_console().print(table)
 
 
     def clone_provider(self, source_provider: str, target_provider: str):
@@ -153,13 +152,15 @@ class ConfigProvider(ABC):
             bool: True if cloning was successful, False otherwise.
         """
         if not self.provider_exists(source_provider):
-            console.print(f"[red]Source provider '{source_provider}' does not exist.[/red]")
+            get_console().print(f"[red]Source provider '{source_provider}' does not exist.[/red]")
             return False
 
         if self.provider_exists(target_provider):
-            console.print(f"[red]Target provider '{target_provider}' already exists.[/red]")
+            get_console().print(f"[red]Target provider '{target_provider}' already exists.[/red]")
             return False
 
+        from InquirerPy import inquirer
+
         source_metadata = self.get_provider_metadata(source_provider)
 
         # Ask for a new friendly name
@@ -172,7 +173,7 @@ class ConfigProvider(ABC):
 
         self.create_provider(target_provider)
         self.set_provider_metadata(target_provider, source_metadata)
-        console.print(f"[green]Provider '{source_provider}' cloned to '{target_provider}' successfully.[/green]")
+        get_console().print(f"[green]Provider '{source_provider}' cloned to '{target_provider}' successfully.[/green]")
         return True
 
 
@@ -186,6 +187,8 @@ class ConfigProvider(ABC):
         Args:
             provider (str): The name of the provider to configure.
         """
+        from InquirerPy import inquirer
+
         if self.provider_exists(provider):
             action = inquirer.select(
                 message=f"Provider '{provider}' already exists. What would you like to do?",
@@ -195,7 +198,7 @@ class ConfigProvider(ABC):
             if action == "Delete":
                 if inquirer.confirm(message=f"Are you sure you want to delete the provider '{provider}'?", default=False).execute():
                     self.delete_provider(provider)
-                    console.print(f"[green]Provider '{provider}' has been deleted.[/green]")
+                    get_console().print(f"[green]Provider '{provider}' has been deleted.[/green]")
                 return
             elif action == "Clone":
                 new_provider = inquirer.text(message="Enter the name for the cloned provider:").execute()
@@ -204,13 +207,13 @@ class ConfigProvider(ABC):
                 else:
                     return
             elif action == "Cancel":
-                console.print("[yellow]Operation cancelled.[/yellow]")
+                get_console().print("[yellow]Operation cancelled.[/yellow]")
                 return
         else:
             if inquirer.confirm(message=f"Provider '{provider}' does not exist. Do you want to create it?", default=True).execute():
                 self.create_provider(provider)
             else:
-                console.print("[yellow]Operation cancelled.[/yellow]")
+                get_console().print("[yellow]Operation cancelled.[/yellow]")
                 return
 
         existing_metadata = self.get_provider_metadata(provider)
@@ -244,9 +247,9 @@ class ConfigProvider(ABC):
 
         if inquirer.confirm(message="Do you want to save these changes?", default=True).execute():
             self.set_provider_metadata(provider, new_metadata)
-            console.print(f"[green]Provider {provider} configured successfully.[/green]")
+            get_console().print(f"[green]Provider {provider} configured successfully.[/green]")
         else:
-            console.print("[yellow]Configuration cancelled. No changes were saved.[/yellow]")
+            get_console().print("[yellow]Configuration cancelled. No changes were saved.[/yellow]")
 
 
 
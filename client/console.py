@@ -0,0 +1,16 @@
+"""
+This module provides the rich console shared by the client package.
+
+rich is only imported, and the console only built, once something is printed.
+"""
+
+_console = None
+
+
+def get_console():
+    """Return the shared console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
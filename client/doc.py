@@ -5,12 +5,10 @@ It includes the DocGenerator class, which can extract docstrings from Python
 files and convert them into a Markdown format for easy documentation generation.
 """
 
-import importlib
-import importlib.util
-import sys
 import os
 import ast
-from typing import List, Tuple, NamedTuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple, NamedTuple
 
 class DocItem(NamedTuple):
     """
@@ -28,6 +26,13 @@ class DocItem(NamedTuple):
     type: str
 
 
+# Turns an item name into its Markdown heading anchor in a single pass
+_ANCHOR_TABLE = str.maketrans({' ': '-', '.': ''})
+
+# Extracted docstrings per absolute path, tagged with the (mtime, size) they were read at
+_docstring_cache: Dict[str, Tuple[Tuple[int, int], List[DocItem]]] = {}
+
+
 class DocGenerator:
     """
     A class for generating documentation from Python source files.
@@ -37,59 +42,68 @@ class DocGenerator:
     """
 
     @staticmethod
-    def import_path(path):
+    def iter_docstrings(node: ast.Module) -> Iterator[DocItem]:
         """
-        Import a Python file from a given path.
+        Yield the docstrings of a parsed module in source order.
+
+        The module docstring comes first, then each top-level function or class
+        followed directly by its methods, so no sorting is needed afterwards.
 
         Args:
-            path (str): The path to the Python file.
+            node (ast.Module): The parsed module.
 
-        Returns:
-            module: The imported module object.
+        Yields:
+            DocItem: The documentation items, ordered by line number.
         """
-        module_name = os.path.basename(path).replace("-", "_")
-        spec = importlib.util.spec_from_loader(
-            module_name,
-            importlib.machinery.SourceFileLoader(module_name, path),
-        )
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        sys.modules[module_name] = module
-        return module
+        module_doc = ast.get_docstring(node)
+        if module_doc:
+            yield DocItem("Module", module_doc, 0, "module")
+
+        for item in node.body:
+            if isinstance(item, (ast.FunctionDef, ast.ClassDef)):
+                doc = ast.get_docstring(item)
+                if doc:
+                    yield DocItem(item.name, doc, item.lineno, type(item).__name__)
+                if isinstance(item, ast.ClassDef):
+                    for method in item.body:
+                        if isinstance(method, ast.FunctionDef):
+                            method_doc = ast.get_docstring(method)
+                            if method_doc:
+                                yield DocItem(f"{item.name}.{method.name}", method_doc, method.lineno, "method")
 
 
     @staticmethod
-    def extract_docstrings(filename: str) -> List[DocItem]:
+    def extract_docstrings(filename: str, source: Optional[bytes] = None) -> List[DocItem]:
         """
         Extract docstrings from a Python file.
 
+        Results are cached per file and reused as long as the file's
+        modification time and size are unchanged. Callers that already hold
+        the file contents can pass them as source to skip the read.
+
         Args:
-            filename (str): The path to the Python file.
+            filename          (str): The path to the Python file.
+            source (Optional[bytes]): The file contents, if already loaded.
 
         Returns:
             List[DocItem]: A list of DocItem objects containing the extracted docstrings.
         """
-        with open(filename, 'r') as file:
-            lines = file.readlines()
-            node = ast.parse(''.join(lines))
+        if source is not None:
+            return list(DocGenerator.iter_docstrings(ast.parse(source, filename)))
 
-        module_doc = ast.get_docstring(node)
-        all_docs = [DocItem("Module", module_doc, 0, "module")] if module_doc else []
+        path = os.path.abspath(filename)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _docstring_cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return list(cached[1])
 
-        for item in node.body:
-            if isinstance(item, (ast.FunctionDef, ast.ClassDef)):
-                doc = ast.get_docstring(item)
-                if doc:
-                    all_docs.append(DocItem(item.name, doc, item.lineno, type(item).__name__))
-                if isinstance(item, ast.ClassDef):
-                    for method in item.body:
-                        if isinstance(method, ast.FunctionDef):
-                            method_doc = ast.get_docstring(method)
-                            if method_doc:
-                                all_docs.append(DocItem(f"{item.name}.{method.name}", method_doc, method.lineno, "method"))
+        with open(path, 'rb') as file:
+            node = ast.parse(file.read(), filename)
 
-        all_docs.sort(key=lambda x: x.lineno)
-        return all_docs
+        all_docs = list(DocGenerator.iter_docstrings(node))
+        _docstring_cache[path] = (signature, all_docs)
+        return list(all_docs)
 
 
     @staticmethod
@@ -107,23 +121,22 @@ class DocGenerator:
             str: The generated Markdown content.
         """
         base_name = os.path.splitext(os.path.basename(filename))[0]
-        content = f"# {title or base_name}\n\n"
+        parts = [f"# {title or base_name}\n\n"]
 
         if toc:
-            content += "## Table of Contents\n\n"
+            parts.append("## Table of Contents\n\n")
             for i, doc_item in enumerate(docstrings, 1):
-                anchor = doc_item.name.lower().replace(" ", "-").replace(".", "")
-                content += f"{i}. [{doc_item.name}](#{anchor})\n"
-            content += "\n"
+                anchor = doc_item.name.translate(_ANCHOR_TABLE).lower()
+                parts.append(f"{i}. [{doc_item.name}](#{anchor})\n")
+            parts.append("\n")
 
         for doc_item in docstrings:
             if doc_item.type == "module":
-                content += doc_item.doc.strip() + "\n\n"
+                parts.append(f"{doc_item.doc.strip()}\n\n")
             else:
-                content += f"## {doc_item.name}\n\n"
-                content += doc_item.doc.strip() + "\n\n"
+                parts.append(f"## {doc_item.name}\n\n{doc_item.doc.strip()}\n\n")
 
-        return content
+        return "".join(parts)
 
 
     @classmethod
@@ -141,6 +154,30 @@ class DocGenerator:
         Returns:
             str: The generated Markdown documentation.
         """
-        module = cls.import_path(filename)
         docstrings = cls.extract_docstrings(filename)
         return cls.convert_to_markdown(docstrings, filename, title, toc)
+
+
+    @classmethod
+    def generate_docs(cls, filenames: List[str], title: str = None, toc: bool = False) -> Dict[str, str]:
+        """
+        Generate documentation for several Python files in parallel.
+
+        Each file is parsed in its own worker process, so large batches scale
+        with the number of CPU cores.
+
+        Args:
+            filenames (List[str]): The paths to the Python files.
+            title  (str, optional): The title for each document. Defaults to each filename.
+            toc   (bool, optional): Whether to include a table of contents. Defaults to False.
+
+        Returns:
+            Dict[str, str]: The generated Markdown documentation keyed by filename.
+        """
+        if len(filenames) <= 1:
+            return {filename: cls.generate_doc(filename, title, toc) for filename in filenames}
+
+        with ProcessPoolExecutor(max_workers=min(len(filenames), os.cpu_count() or 1)) as executor:
+            results = executor.map(cls.generate_doc, filenames,
+                                   [title] * len(filenames), [toc] * len(filenames))
+            return dict(zip(filenames, results))
@@ -1,18 +1,77 @@
 """Handles document styling based on CSS."""
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple, Union
+import os
 import re
 import tinycss
 from docx.shared import Pt, RGBColor, Inches
 from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml import parse_xml
-from docx.oxml.ns import nsdecls, qn
-from rich.console import Console
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from .console import get_console
+
+
+_PX_RE = re.compile(r'(-?\d+)px')
+
+# Properties holding pixel lengths; DocumentStyles converts them to ints once
+_PX_PROPERTIES = frozenset({
+    'font-size', 'line-height', 'margin-top', 'margin-bottom',
+    'text-indent', 'padding-top', 'padding-bottom'
+})
+
+# Resolved once instead of on every styled paragraph
+_W_LINE = qn('w:line')
+_W_LINE_RULE = qn('w:lineRule')
+_W_FILL = qn('w:fill')
+_W_VAL = qn('w:val')
+
+
+def _px(value: Union[str, int]) -> int:
+    """Convert a CSS pixel value such as '12px' to an int, rejecting other units."""
+    if isinstance(value, int):
+        return value
+    match = _PX_RE.fullmatch(value.strip())
+    if match is None:
+        raise ValueError(f"Not a pixel value: {value!r}")
+    return int(match.group(1))
+
+
+def _resolve_px(css_props: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of css_props with pixel lengths already converted to ints."""
+    resolved = dict(css_props)
+    for name in _PX_PROPERTIES.intersection(css_props):
+        try:
+            resolved[name] = _px(css_props[name])
+        except (ValueError, AttributeError):
+            pass  # Leave unparseable values to fail where they are applied
+    return resolved
+
+
+# Parsed stylesheets and built DocumentStyles per absolute path, tagged with the (mtime, size) they were read at
+_css_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Dict[str, Any]]]] = {}
+_document_styles_cache: Dict[str, Tuple[Tuple[int, int], 'DocumentStyles']] = {}
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """Return (mtime, size) of a file, or None if it cannot be read."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
 
-console = Console()
 
 def parse_css_file(css_path: str) -> Dict[str, Dict[str, Any]]:
-    """Parse CSS file and return style definitions."""
+    """Parse CSS file and return style definitions.
+
+    Results are cached per file while its modification time and size are unchanged.
+    """
+    path = os.path.abspath(css_path)
+    signature = _file_signature(path)
+    cached = _css_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        return dict(cached[1])
+
     parser = tinycss.make_parser('page3')
 
     try:
@@ -20,7 +79,7 @@ def parse_css_file(css_path: str) -> Dict[str, Dict[str, Any]]:
             css_content = f.read()
             stylesheet = parser.parse_stylesheet(css_content)
     except Exception as e:
-        console.print(f"[red]Error reading CSS file: {str(e)}[/red]")
+        get_console().print(f"[red]Error reading CSS file: {str(e)}[/red]")
         return {}
 
     styles = {}
@@ -33,7 +92,9 @@ def parse_css_file(css_path: str) -> Dict[str, Dict[str, Any]]:
 
         styles[style_name] = properties
 
-    return styles
+    if signature is not None:
+        _css_cache[path] = (signature, styles)
+    return dict(styles)
 
 def apply_css_to_style(style, css_props):
     """Apply CSS properties to a Word style."""
@@ -43,17 +104,17 @@ def apply_css_to_style(style, css_props):
         rPr = style._element.get_or_add_rPr()
 
         if 'font-size' in css_props:
-            size = int(re.match(r'(\d+)px', css_props['font-size']).group(1))
+            size = _px(css_props['font-size'])
             word_units = size * 2
             rPr.get_or_add_sz().val = word_units
 
     # Regular style properties
     if 'font-size' in css_props:
-        size = int(re.match(r'(\d+)px', css_props['font-size']).group(1))
+        size = _px(css_props['font-size'])
         style.font.size = Pt(size)
 
     if 'line-height' in css_props:
-        height = int(re.match(r'(\d+)px', css_props['line-height']).group(1))
+        height = _px(css_props['line-height'])
         style.paragraph_format.line_spacing = height / 12
 
     # Handle text transformation
@@ -88,84 +149,102 @@ def apply_css_to_style(style, css_props):
         pPr = style._element.get_or_add_pPr()
 
         # Create shading element that extends to paragraph edges
-        shd = parse_xml(f'<w:shd {nsdecls("w")} w:fill="{color}" w:val="clear"/>')
+        shd = OxmlElement('w:shd')
+        shd.set(_W_FILL, color)
+        shd.set(_W_VAL, 'clear')
         pPr.append(shd)
 
         # Get or create spacing element
         spacing = pPr.get_or_add_spacing()
 
         # Calculate total line height including padding
-        base_height = int(css_props.get('line-height', '20').rstrip('px'))
-        padding_top = int(css_props.get('padding-top', '0').rstrip('px'))
-        padding_bottom = int(css_props.get('padding-bottom', '0').rstrip('px'))
+        base_height = _px(css_props.get('line-height', 20))
+        padding_top = _px(css_props.get('padding-top', 0))
+        padding_bottom = _px(css_props.get('padding-bottom', 0))
         total_height = base_height + padding_top + padding_bottom
 
         # Set line spacing to include padding
-        spacing.set(qn('w:line'), str(total_height * 20))
-        spacing.set(qn('w:lineRule'), 'exact')
+        spacing.set(_W_LINE, str(total_height * 20))
+        spacing.set(_W_LINE_RULE, 'exact')
 
         # Set vertical alignment within the line
         if padding_top != padding_bottom:
             # If padding is uneven, adjust text position
-            textAlignment = parse_xml(f'<w:textAlignment {nsdecls("w")} w:val="center"/>')
+            textAlignment = OxmlElement('w:textAlignment')
+            textAlignment.set(_W_VAL, 'center')
             pPr.append(textAlignment)
 
     # Handle external margins
     if 'margin-top' in css_props:
-        margin = int(re.match(r'(\d+)px', css_props['margin-top']).group(1))
+        margin = _px(css_props['margin-top'])
         style.paragraph_format.space_before = Pt(margin)
 
     if 'margin-bottom' in css_props:
-        margin = int(re.match(r'(\d+)px', css_props['margin-bottom']).group(1))
+        margin = _px(css_props['margin-bottom'])
         style.paragraph_format.space_after = Pt(margin)
 
     # Handle text indentation
     if 'text-indent' in css_props:
-        indent = int(re.match(r'(-?\d+)px', css_props['text-indent']).group(1))
+        indent = _px(css_props['text-indent'])
         style.paragraph_format.first_line_indent = Inches(indent/72)
 
 class DocumentStyles:
+    # Map CSS styles to Word styles
+    _MAPPINGS = (
+        ('heading1', 'Heading 1'),
+        ('heading2', 'Heading 2'),
+        ('heading3', 'Heading 3'),
+        ('heading4', 'Heading 4'),
+        ('bullet', 'List Bullet'),
+        ('bodytext', 'Normal'),
+    )
+
     def __init__(self, css_path: str):
         self.styles = parse_css_file(css_path)
         self.bullet_font_size = None
         if 'bullet' in self.styles and 'font-size' in self.styles['bullet']:
-            size = int(re.match(r'(\d+)px', self.styles['bullet']['font-size']).group(1))
+            size = _px(self.styles['bullet']['font-size'])
             self.bullet_font_size = size  # Store raw pixel size
 
+        # Resolved once so that every document reuses the parsed pixel values
+        self._present_mappings = [
+            (word_name, _resolve_px(self.styles[css_name]))
+            for css_name, word_name in self._MAPPINGS if css_name in self.styles
+        ]
+        self._missing_styles = [css_name for css_name, _ in self._MAPPINGS if css_name not in self.styles]
+
     def apply_to_document(self, doc):
         """Apply CSS styles to document."""
-        # Map CSS styles to Word styles
-        style_mappings = {
-            'heading1': 'Heading 1',
-            'heading2': 'Heading 2',
-            'heading3': 'Heading 3',
-            'heading4': 'Heading 4',
-            'bullet': 'List Bullet',
-            'bodytext': 'Normal'
-        }
+        for css_name in self._missing_styles:
+            get_console().print(f"[yellow]Warning: Style {css_name} not found in CSS[/yellow]")
 
         # Create and apply styles
-        for css_name, word_name in style_mappings.items():
-            if css_name in self.styles:
-                if word_name not in doc.styles:
-                    if word_name == 'List Bullet':
-                        # Special handling for bullet style
-                        style = doc.styles.add_style(word_name, WD_STYLE_TYPE.PARAGRAPH)
-                        style.base_style = None  # Remove inheritance
-                    else:
-                        style = doc.styles.add_style(word_name, WD_STYLE_TYPE.PARAGRAPH)
+        for word_name, css_props in self._present_mappings:
+            if word_name not in doc.styles:
+                if word_name == 'List Bullet':
+                    # Special handling for bullet style
+                    style = doc.styles.add_style(word_name, WD_STYLE_TYPE.PARAGRAPH)
+                    style.base_style = None  # Remove inheritance
                 else:
-                    style = doc.styles[word_name]
-                    if word_name == 'List Bullet':
-                        style.base_style = None  # Remove inheritance
-
-                apply_css_to_style(style, self.styles[css_name])
+                    style = doc.styles.add_style(word_name, WD_STYLE_TYPE.PARAGRAPH)
             else:
-                console.print(f"[yellow]Warning: Style {css_name} not found in CSS[/yellow]")
+                style = doc.styles[word_name]
+                if word_name == 'List Bullet':
+                    style.base_style = None  # Remove inheritance
+
+            apply_css_to_style(style, css_props)
 
 def apply_styles_to_document(doc, css_path: str):
     """Apply CSS styles to document."""
-    doc_styles = DocumentStyles(css_path)
+    path = os.path.abspath(css_path)
+    signature = _file_signature(path)
+    cached = _document_styles_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        doc_styles = cached[1]
+    else:
+        doc_styles = DocumentStyles(css_path)
+        if signature is not None:
+            _document_styles_cache[path] = (signature, doc_styles)
 
     # Add hyperlink style
     if 'Hyperlink' not in doc.styles:
@@ -8,11 +8,10 @@ as the backend for storing and retrieving configuration data.
 import os
 import subprocess
 from typing import Optional, List, Dict
-from rich.console import Console
-from InquirerPy import inquirer
 from .config_provider import ConfigProvider
+from .console import get_console
+from .gitconfig_cache import canonical_key, invalidate_config, load_config
 
-console = Console()
 
 class GitConfig(ConfigProvider):
     """
@@ -21,34 +20,67 @@ class GitConfig(ConfigProvider):
     This class implements the ConfigProvider interface, using Git config
     commands to store and retrieve configuration data for AI providers.
     """
+    # Resolved once per process, shared by all instances
+    _git_dir: Optional[str] = None
+
     def __init__(self):
         self.git_dir = self._find_git_dir()
+        work_tree = os.path.dirname(self.git_dir)
+        self._git_base = ["git", f"--git-dir={self.git_dir}", f"--work-tree={work_tree}"]
+        self._providers_cache: Optional[List[str]] = None
 
     def _find_git_dir(self):
-        """Find the .git directory relative to the scocr.py file."""
-        # Get the directory of the scocr.py file
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-
-        # Traverse up the directory tree from the script location
-        current_dir = script_dir
-        while current_dir != '/':
-            git_dir = os.path.join(current_dir, '.git')
-            if os.path.exists(git_dir):
-                return git_dir
-            current_dir = os.path.dirname(current_dir)
-
-        raise ValueError("No .git directory found in the parent directories of scocr.py")
+        """Find the .git directory of the repository containing this package."""
+        if GitConfig._git_dir is None:
+            script_dir = os.path.dirname(os.path.abspath(__file__))
+            result = subprocess.run(["git", "rev-parse", "--absolute-git-dir"],
+                                    cwd=script_dir, capture_output=True, text=True)
+            if result.returncode != 0:
+                raise ValueError(f"No .git directory found for {script_dir}")
+            GitConfig._git_dir = result.stdout.strip()
+        return GitConfig._git_dir
 
     def _run_git_command(self, args):
-        work_tree = os.path.dirname(self.git_dir)
-        full_args = ["git", f"--git-dir={self.git_dir}", f"--work-tree={work_tree}"]
-        full_args.extend(args)
+        full_args = self._git_base + args
         # print(" ".join(full_args))
         result = subprocess.run(full_args, capture_output=True, text=True)
         return result
 
+    def _load_config(self) -> Dict[str, str]:
+        """
+        Read the whole Git config with a single `git config --list` call.
+
+        The parsed result is shared with GitWrapper for the process lifetime
+        and dropped whenever this class writes to the config.
+
+        Returns:
+            Dict[str, str]: All config keys (in Git's canonical lower-case form) and their values.
+        """
+        return load_config(self.git_dir, lambda: self._run_git_command(["config", "--list", "-z"]).stdout)
+
+    def _get_section(self, prefix: str) -> Dict[str, str]:
+        """
+        Collect all variables of one config section from the cached config.
+
+        Args:
+            prefix (str): The section name, e.g. a provider name.
+
+        Returns:
+            Dict[str, str]: The section's variables (without the prefix) and their values.
+        """
+        start = f"{prefix.lower()}."
+        return {
+            key[len(start):]: value
+            for key, value in self._load_config().items()
+            if key.startswith(start) and '.' not in key[len(start):]
+        }
+
+    def _invalidate_config(self):
+        """Drop the cached config so the next read sees our own writes."""
+        invalidate_config(self.git_dir)
 
-    def get_metadata(self, key: str) -> Optional[str]:
+
+    def get_metadata(self, key: str) -> str:
         """
         Retrieve a metadata value from Git config.
 
@@ -56,13 +88,9 @@ class GitConfig(ConfigProvider):
             key (str): The key to retrieve.
 
         Returns:
-            Optional[str]: The value associated with the key, or None if not found.
+            str: The value associated with the key, or an empty string if not found.
         """
-        try:
-            result = self._run_git_command(["config", "--get", key])
-            return result.stdout.strip()
-        except subprocess.CalledProcessError:
-            return None
+        return self._load_config().get(canonical_key(key), '').strip()
 
 
     def set_metadata(self, key: str, value: str):
@@ -75,30 +103,30 @@ class GitConfig(ConfigProvider):
         """
         try:
             self._run_git_command(["config", key, value])
-            console.print(f"[green]{key} saved successfully to local config.[/green]")
+            self._invalidate_config()
+            get_console().print(f"[green]{key} saved successfully to local config.[/green]")
         except subprocess.CalledProcessError as e:
-            console.print(f"[red]Failed to save {key} to local config: {e}[/red]")
-            console.print(f"[red]Command attempted: git config --local {key} {value}[/red]")
+            get_console().print(f"[red]Failed to save {key} to local config: {e}[/red]")
+            get_console().print(f"[red]Command attempted: git config --local {key} {value}[/red]")
 
 
     def get_available_providers(self) -> List[str]:
         """
         Get a list of available AI providers from Git config.
 
+        The list is cached for the lifetime of this object and refreshed
+        after providers are created, updated or deleted.
+
         Returns:
             List[str]: A list of provider names.
         """
-        try:
-            result = self._run_git_command(["config", "--get-regexp", "^[^.]+\\.aiprovider$"])
-            providers = [line.split('.')[0] for line in result.stdout.splitlines() if line.endswith('true')]
-            #print(f"Available providers: {providers}")  # Debug print
-            return providers
-        except subprocess.CalledProcessError as e:
-            #print(f"Error getting available providers: {e}")  # Debug print
-            if e.returncode == 1:
-                # No matching configuration found, which is not an error
-                return []
-            raise  # Re-raise the exception for other error codes
+        if self._providers_cache is None:
+            self._providers_cache = [
+                key[:-len('.aiprovider')]
+                for key, value in self._load_config().items()
+                if key.endswith('.aiprovider') and key.count('.') == 1 and value == 'true'
+            ]
+        return list(self._providers_cache)
 
 
     def create_provider(self, provider: str):
@@ -109,6 +137,7 @@ class GitConfig(ConfigProvider):
                 provider (str): The name of the new provider.
             """
             self.set_metadata(f"{provider}.aiprovider", "true")
+            self._providers_cache = None
 
 
     def get_provider_metadata(self, provider: str) -> Dict[str, str]:
@@ -121,13 +150,9 @@ class GitConfig(ConfigProvider):
         Returns:
             Dict[str, str]: A dictionary of metadata key-value pairs.
         """
-        metadata = {}
+        section = self._get_section(provider)
         keys = ['name', 'url', 'apikey', 'model', 'header', 'response']
-        for key in keys:
-            value = self.get_metadata(f"{provider}.{key}")
-            if value:
-                metadata[key] = value
-        return metadata
+        return {key: section[key] for key in keys if section.get(key)}
 
 
     def set_provider_metadata(self, provider: str, metadata: Dict[str, str]):
@@ -137,9 +162,26 @@ class GitConfig(ConfigProvider):
         Args:
             provider            (str): The name of the provider.
             metadata (Dict[str, str]): A dictionary of metadata key-value pairs.
+
+        Keys that already hold the given value are not rewritten, and a single
+        confirmation line is printed for the whole batch.
         """
-        for key, value in metadata.items():
-            self.set_metadata(f"{provider}.{key}", value)
+        section = self._get_section(provider)
+        changed = {key: value for key, value in metadata.items() if section.get(key.lower()) != value}
+
+        failed = []
+        for key, value in changed.items():
+            result = self._run_git_command(["config", f"{provider}.{key}", value])
+            if result.returncode != 0:
+                failed.append(key)
+        if changed:
+            self._invalidate_config()
+        self._providers_cache = None
+
+        if failed:
+            get_console().print(f"[red]Failed to save {', '.join(failed)} for {provider} to local config.[/red]")
+        else:
+            get_console().print(f"[green]{provider} saved successfully to local config.[/green]")
 
 
     def delete_provider(self, provider: str):
@@ -155,7 +197,9 @@ class GitConfig(ConfigProvider):
                 self._run_git_command(["config", "--local", "--unset", f"{provider}.{key}"])
             except subprocess.CalledProcessError:
                 pass  # Ignore if the key doesn't exist
-        #console.print(f"[green]Provider {provider} deleted successfully.[/green]")
+        self._invalidate_config()
+        self._providers_cache = None
+        #get_console().print(f"[green]Provider {provider} deleted successfully.[/green]")
 
 
     def get_default_provider(self) -> Optional[str]:
@@ -172,8 +216,12 @@ class GitConfig(ConfigProvider):
         available_providers = self.get_available_providers()
         if not available_providers:
             raise ValueError("No AI providers found in git config.")
+        if len(available_providers) == 1:
+            return available_providers[0]
+
+        from InquirerPy import inquirer
 
-        provider_names = {p: self.get_metadata(f"{p}.name") for p in available_providers}
+        provider_names = {p: self._get_section(p).get('name', '') for p in available_providers}
         choices = list(provider_names.values())
 
         selected_name = inquirer.select(
@@ -187,6 +235,6 @@ class GitConfig(ConfigProvider):
     def set_default_provider_interactive(self):
         provider = self.select_provider("Select an AI provider to set as default:")
         self.set_default_provider(provider)
-        friendly_name = self.get_metadata(f"{provider}.name")
-        console.print(f"[green]Default AI provider set to: {friendly_name} ({provider})[/green]")
+        friendly_name = self._get_section(provider).get('name', '')
+        get_console().print(f"[green]Default AI provider set to: {friendly_name} ({provider})[/green]")
 
@@ -0,0 +1,80 @@
+"""
+This module keeps one parsed `git config --list -z` snapshot per git directory.
+
+GitConfig and GitWrapper both read and write the same repository config; sharing
+the snapshot means a write through either one is seen by the other.
+"""
+
+import os
+from typing import Callable, Dict
+
+# Parsed `git config --list -z` output per git directory, shared for the process lifetime
+_config_cache: Dict[str, Dict[str, str]] = {}
+
+
+def canonical_key(key: str) -> str:
+    """
+    Normalize a config key the way Git reports it in `git config --list`.
+
+    Section and variable names are case-insensitive and reported in lower
+    case, while a subsection keeps its case.
+
+    Args:
+        key (str): The key as passed by the caller, e.g. "OpenAI.Name".
+
+    Returns:
+        str: The canonical key, e.g. "openai.name".
+    """
+    section, _, rest = key.partition('.')
+    subsection, dot, name = rest.rpartition('.')
+    return f"{section.lower()}.{subsection}{dot}{name.lower()}"
+
+
+def load_config(git_dir: str, read: Callable[[], str]) -> Dict[str, str]:
+    """
+    Return the cached config of a repository, reading it on first use.
+
+    Args:
+        git_dir             (str): The repository's .git directory.
+        read (Callable[[], str]): Returns the output of `git config --list -z` for it.
+
+    Returns:
+        Dict[str, str]: All config keys (in Git's canonical form) and their values.
+    """
+    cache_key = os.path.realpath(git_dir)
+    config = _config_cache.get(cache_key)
+    if config is None:
+        config = {}
+        for entry in read().split('\0'):
+            if entry:
+                key, _, value = entry.partition('\n')
+                config[key] = value
+        _config_cache[cache_key] = config
+    return config
+
+
+def update_config(git_dir: str, key: str, value: str):
+    """
+    Record a value just written to the local config, if the config is cached.
+
+    The local scope wins over global and system, so patching the snapshot
+    gives the same result as reading it again.
+
+    Args:
+        git_dir (str): The repository's .git directory.
+        key     (str): The key that was written, in any case.
+        value   (str): The value that was written.
+    """
+    config = _config_cache.get(os.path.realpath(git_dir))
+    if config is not None:
+        config[canonical_key(key)] = value
+
+
+def invalidate_config(git_dir: str):
+    """
+    Drop the cached config of a repository so the next read goes to git.
+
+    Args:
+        git_dir (str): The repository's .git directory.
+    """
+    _config_cache.pop(os.path.realpath(git_dir), None)
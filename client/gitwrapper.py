@@ -1,22 +1,154 @@
 from datetime import datetime
-from git import Repo, GitCommandError
-from InquirerPy import inquirer
+from git import Commit, Repo, GitCommandError
+from git.exc import BadName, BadObject
 from pathlib import Path
-from rich.console import Console
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterator, List, Set, Tuple, Union
+from urllib.parse import urlparse
+from .console import get_console
+from .gitconfig_cache import canonical_key, invalidate_config, load_config, update_config
+import codecs
+import os
+import re
+import socket
 import subprocess
 import sys
+import time
+
+# Abbreviated or full object names; these always resolve to the same object
+_SHA_RE = re.compile(r'^[0-9a-f]{7,40}$')
+
+# Git error messages the push and delete paths react to
+_ERR_PATTERNS = {
+    "protected": re.compile(r"protected branch", re.IGNORECASE),
+    "uptodate": re.compile(r"up-to-date", re.IGNORECASE),
+    "no_remote_ref": re.compile(r"remote ref does not exist", re.IGNORECASE),
+    # The remote could not be reached at all
+    "no_network": re.compile(
+        r"Could not resolve host|Network is unreachable|Connection timed out|"
+        r"Operation timed out|Connection refused|Failed to connect",
+        re.IGNORECASE
+    ),
+}
+
+def _push_rejections(output: str) -> Dict[str, str]:
+    """Collect the refs a remote rejected from `git push --porcelain` output.
+
+    Args:
+        output (str): The standard output of the push
+
+    Returns:
+        Dict[str, str]: The summary and reason of each rejected ref, keyed by its from:to refspec
+    """
+    rejected = {}
+    for line in output.splitlines():
+        # Ref lines are `<flag>\t<from>:<to>\t<summary>`; `!` marks a rejected ref
+        flag, _, rest = line.partition('\t')
+        if flag == '!':
+            refspec, _, summary = rest.partition('\t')
+            rejected[refspec] = summary
+    return rejected
+
+def _end_stream(process, command: List[str], completed: bool):
+    """Reap a git process started with `as_process=True`.
+
+    Args:
+        process: The process GitPython returned
+        command (List[str]): The command line, for the error message
+        completed (bool): Whether its output was read to the end
+
+    Raises:
+        GitCommandError: If the output was read to the end but git exited with an error
+    """
+    if not completed:
+        # The consumer stopped early; don't leave git blocked on a full pipe
+        process.proc.terminate()
+        process.proc.wait()
+        return
+    status = process.proc.wait()
+    if status != 0:
+        raise GitCommandError(command, status, process.proc.stderr.read())
+
+# "[ahead 2, behind 1]" as reported by %(upstream:track)
+_TRACK_RE = re.compile(r'(ahead|behind) (\d+)')
+
+# delete_branch announcements, keyed by (remote deletion) | (local deletion << 1)
+_DELETE_ACTIONS = {
+    0b01: "remote branch",
+    0b10: "local branch",
+    0b11: "remote and local branches",
+}
+
+# owner and repository of a GitHub remote URL (https or ssh form)
+_GITHUB_REPO_RE = re.compile(r'github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?/?$')
+
+_github_session = None
+
+
+def _get_github_session(token: str):
+    """Return the HTTP session used for GitHub API calls, creating it on first use.
+
+    Args:
+        token (str): The GitHub token sent with every request
+
+    Returns:
+        requests.Session: A keep-alive session carrying the API headers
+    """
+    global _github_session
+    if _github_session is None:
+        import requests
+        session = requests.Session()
+        session.headers.update({
+            'Accept': 'application/vnd.github+json',
+            'Authorization': f'Bearer {token}',
+            'X-GitHub-Api-Version': '2022-11-28',
+        })
+        _github_session = session
+    return _github_session
+
+# `git remote` subcommands that change the configured remotes
+_REMOTE_MUTATIONS = frozenset({'add', 'remove', 'rm', 'rename', 'set-url'})
+
+# Branch name builders by branch type, called as (wrapper, name, week); None marks an invalid combination
+_BRANCH_NAMERS = {
+    'hotfix': lambda wrapper, name, week: f"hotfix/{name}" if name else f"hotfix/week-{wrapper.get_week_number(week)}",
+    'release': lambda wrapper, name, week: f"release/{name}" if name else None,
+    'local': lambda wrapper, name, week: name or None,
+}
+
 
 class GitWrapper:
+    # Seconds a check_network_connection result stays valid
+    NETWORK_CACHE_TTL = 5.0
+    # Seconds a working tree status snapshot stays valid without a mutating call
+    STATUS_CACHE_TTL = 2.0
+
     def __init__(self):
         path = Path.cwd()
         self.repo = Repo(path, search_parent_directories=True)
-        self.console = Console()
+        self._repo_root = Path(self.repo.working_tree_dir)
+        # Built once for every direct git call: skip optional index locks, parse untranslated output
+        self._git_env = {**os.environ, 'GIT_OPTIONAL_LOCKS': '0', 'LC_ALL': 'C'}
 
         if self.repo is None:
             self.console.print("[red]Error: Not in a valid Git repository[/red]")
             sys.exit(1)
         self.temp_branches = []
+        self._net_cache: Optional[Tuple[float, bool]] = None
+        self._net_endpoint: Optional[Tuple[str, int]] = None
+        self._net_endpoint_resolved = False
+        self._refs_cache: Optional[Dict[str, List[str]]] = None
+        self._branches_cache: Optional[Set[str]] = None
+        self._remotes_cache: Optional[List[Tuple[str, str]]] = None
+        self._sha_cache: Dict[str, str] = {}
+        self._rev_parse_cache: Dict[str, Tuple[float, str]] = {}
+        self._branch_statuses_cache: Optional[Tuple[float, Dict[str, dict]]] = None
+        self._status_cache: Optional[Tuple[float, Dict[str, List[str]]]] = None
+        self._remote_heads: Optional[Tuple[float, Dict[str, str]]] = None
+
+    @property
+    def console(self):
+        """The shared rich console, only imported and built once something is printed."""
+        return get_console()
 
     # -----------------------------------
     # Repository Information and Metadata
@@ -24,8 +156,7 @@ class GitWrapper:
 
     def get_repo_root(self):
         """Get the root directory of the current Git repository."""
-        repo_root = Path(self.repo.git.rev_parse("--show-toplevel"))
-        return repo_root
+        return self._repo_root
 
     def get_git_dir(self):
         """Get the .git directory path."""
@@ -52,15 +183,113 @@ class GitWrapper:
 
     def get_local_branches(self):
         """Get a list of all local branches."""
-        return [head.name for head in self.repo.heads]
+        return sorted(self._branches())
+
+    def _enumerate_refs(self) -> Dict[str, List[str]]:
+        """Read local branches, tags and remote-tracking branches with one for-each-ref call.
+
+        Returns:
+            Dict[str, List[str]]: Short ref names under the keys 'heads', 'tags' and 'remotes'
+        """
+        if self._refs_cache is None:
+            refs = {'heads': [], 'tags': [], 'remotes': []}
+            output = self.repo.git.for_each_ref('--format=%(refname)', 'refs/heads/', 'refs/tags/', 'refs/remotes/')
+            for refname in output.splitlines():
+                _, kind, name = refname.split('/', 2)
+                if kind in refs:
+                    refs[kind].append(name)
+            self._refs_cache = refs
+        return self._refs_cache
+
+    def _branches(self) -> Set[str]:
+        """Return the cached set of local branch names."""
+        if self._branches_cache is None:
+            self._branches_cache = set(self._enumerate_refs()['heads'])
+        return self._branches_cache
+
+    def _invalidate_branches(self):
+        """Drop the cached refs after branches or tags were created, renamed, deleted or fetched."""
+        self._refs_cache = None
+        self._branches_cache = None
+        self._rev_parse_cache.clear()
+        self._branch_statuses_cache = None
+
+    def has_local_branch(self, name: str) -> bool:
+        """Check whether a local branch exists, using the cached branch set."""
+        return name in self._branches()
+
+    def get_branch_statuses(self, names: Optional[List[str]] = None) -> Dict[str, dict]:
+        """Get upstream tracking information for local branches with one for-each-ref call.
+
+        Args:
+            names (Optional[List[str]]): The branches to report on; all local branches if None
+
+        Returns:
+            Dict[str, dict]: Per branch its 'upstream' (or None), 'ahead' and 'behind' counts,
+                whether the upstream is 'gone', its commit 'sha' and the commit 'subject'
+        """
+        now = time.monotonic()
+        if self._branch_statuses_cache is None or now - self._branch_statuses_cache[0] >= self.STATUS_CACHE_TTL:
+            output = self.repo.git.for_each_ref(
+                '--format=%(refname:strip=2)%00%(upstream:short)%00%(upstream:track)%00%(objectname)%00%(contents:subject)',
+                'refs/heads/'
+            )
+            statuses = {}
+            for line in output.splitlines():
+                name, upstream, track, sha, subject = line.split('\0', 4)
+                counts = dict(_TRACK_RE.findall(track))
+                statuses[name] = {
+                    'upstream': upstream or None,
+                    'ahead': int(counts.get('ahead', 0)),
+                    'behind': int(counts.get('behind', 0)),
+                    'gone': track == '[gone]',
+                    'sha': sha,
+                    'subject': subject,
+                }
+            self._branch_statuses_cache = (now, statuses)
+
+        statuses = self._branch_statuses_cache[1]
+        wanted = statuses.keys() if names is None else names
+        return {name: dict(statuses[name]) for name in wanted if name in statuses}
+
+    def get_branch_status(self, name: str) -> Optional[dict]:
+        """Get upstream tracking information for a single local branch.
+
+        Args:
+            name (str): The branch name
+
+        Returns:
+            Optional[dict]: The branch's entry from get_branch_statuses, or None if it does not exist
+        """
+        return self.get_branch_statuses([name]).get(name)
 
     def get_remote_branches(self, remote='origin'):
-        """Get a list of all branches from the specified remote."""
-        return [ref.name for ref in self.repo.remote().refs if ref.name != 'origin/HEAD']
+        """Get a list of all branches from the specified remote.
+
+        This enumerates every remote-tracking ref; use remote_branch_exists to
+        check for a single branch.
+        """
+        prefix = f"{remote}/"
+        return [name for name in self._enumerate_refs()['remotes']
+                if name.startswith(prefix) and not name.endswith('/HEAD')]
+
+    def remote_branch_exists(self, name: str, remote='origin') -> bool:
+        """Check whether a remote-tracking branch exists, without listing all refs.
+
+        Args:
+            name   (str): The branch name without the remote prefix
+            remote (str): The remote to look at
+
+        Returns:
+            bool: True if refs/remotes/<remote>/<name> exists locally
+        """
+        return self._run_git(["show-ref", "--verify", "--quiet", f"refs/remotes/{remote}/{name}"]).returncode == 0
 
     def get_remotes(self):
         """Get a list of all remotes with their names and URLs."""
-        return [(remote.name, remote.url) for remote in self.repo.remotes]
+        if self._remotes_cache is None:
+            self._remotes_cache = [(remote.name, remote.url) for remote in self.repo.remotes]
+        return list(self._remotes_cache)
 
     def get_remote_url(self, remote='origin'):
         """Get the URL of the specified remote."""
@@ -72,20 +301,32 @@ class GitWrapper:
 
     def get_git_metadata(self, key: str) -> Optional[str]:
         """Get a specific configuration value from the .git/config file."""
-        try:
-            value = subprocess.check_output(["git", "config", "--get", key], universal_newlines=True).strip()
-            return value
-        except subprocess.CalledProcessError:
-            return None
+        return self._load_config_cache().get(canonical_key(key))
 
     def set_git_metadata(self, key: str, value: str):
         """Set a specific configuration value in the .git/config file."""
         try:
-            subprocess.run(["git", "config", "--local", key, value], check=True)
+            self._run_git(["config", "--local", key, value], check=True)
+            update_config(self.repo.git_dir, key, value)
             self.console.print(f"[green]{key} saved successfully.[/green]")
         except subprocess.CalledProcessError as e:
             self.console.print(f"[red]Failed to save {key}: {e}[/red]")
 
+    def _run_git(self, args: List[str], check: bool = False,
+                 input: Optional[str] = None) -> subprocess.CompletedProcess:
+        """Run a git command directly in the repository root.
+
+        Args:
+            args (List[str]): The git arguments, without the leading 'git'
+            check    (bool): Raise CalledProcessError on a non-zero exit status
+            input     (str): Text fed to the command's standard input
+
+        Returns:
+            subprocess.CompletedProcess: The finished process with text stdout and stderr
+        """
+        return subprocess.run(["git", "--no-pager"] + args, cwd=self._repo_root, env=self._git_env,
+                              capture_output=True, text=True, check=check, input=input)
+
     # -----------------------------------
     # Commit and Tag Operations
     # -----------------------------------
@@ -102,8 +343,35 @@ class GitWrapper:
         """Get the date of a specific commit."""
         return self.repo.commit(commit).committed_datetime
 
+    def get_commit_metadata_batch(self, shas: List[str]) -> Dict[str, Tuple[str, datetime]]:
+        """Get the author and commit date of many commits with a single git log call.
+
+        The revisions are passed on standard input, so any number of them fits.
+        For one commit, get_commit_author and get_commit_date are cheaper, as
+        they read through GitPython's already running cat-file process.
+
+        Args:
+            shas (List[str]): The commits to look up
+
+        Returns:
+            Dict[str, Tuple[str, datetime]]: The author name and committed datetime, keyed by full SHA-1
+
+        Raises:
+            subprocess.CalledProcessError: If one of the revisions cannot be resolved
+        """
+        if not shas:
+            return {}
+        output = self._run_git(["log", "--no-walk=unsorted", "--stdin", "--format=%H%x00%an%x00%cI"],
+                               check=True, input='\n'.join(shas) + '\n').stdout
+        metadata = {}
+        for line in output.splitlines():
+            hexsha, author, committed = line.split('\0')
+            metadata[hexsha] = (author, datetime.fromisoformat(committed))
+        return metadata
+
     def commit(self, message):
         """Commit changes with the specified message."""
+        self._invalidate_status()
         if message == "--no-edit":
             self.repo.git.commit('--no-edit')
         else:
@@ -112,10 +380,11 @@ class GitWrapper:
     def create_tag(self, tag_name, message=None):
         """Create a tag with an optional message."""
         self.repo.create_tag(tag_name, message=message)
+        self._invalidate_branches()
 
     def get_tags(self):
         """Get a list of all tags in the repository."""
-        return [tag.name for tag in self.repo.tags]
+        return list(self._enumerate_refs()['tags'])
 
     def push_tag(self, tag_name):
         """Push a tag to the remote repository."""
@@ -128,10 +397,13 @@ class GitWrapper:
     def create_branch(self, branch_name):
         """Create a new branch."""
         self.repo.git.branch(branch_name)
+        self._invalidate_branches()
 
     def rename_branch(self, old_name, new_name):
         """Rename an existing branch."""
         self.repo.git.branch('-m', old_name, new_name)
+        self._invalidate_branches()
+        self._invalidate_config()
 
     def delete_branch(self, branch, delete_remote=True, delete_local=True):
         """Delete a branch locally and/or remotely.
@@ -143,48 +415,145 @@ class GitWrapper:
         """
         try:
             # Check what actually exists before announcing actions
-            local_exists = branch in [b.name for b in self.repo.branches]
-            remote_exists = False
-            if self.check_network_connection():
-                try:
-                    self.repo.git.ls_remote('--exit-code', 'origin', f'refs/heads/{branch}')
-                    remote_exists = True
-                except GitCommandError:
-                    pass
+            # Only look up the sides we were asked to delete
+            local_exists = delete_local and branch in self._branches()
+            remote_exists = (
+                delete_remote and self.check_network_connection() and branch in self._remote_heads_snapshot()
+            )
 
             # Print what we're actually going to do
-            actions = []
-            if delete_remote and remote_exists:
-                actions.append("remote")
-            if delete_local and local_exists:
-                actions.append("local")
+            actions = _DELETE_ACTIONS.get(int(remote_exists) | int(local_exists) << 1)
             if actions:
-                self.console.print(f"[blue]Deleting {' and '.join(actions)} branch{'es' if len(actions) > 1 else ''} '{branch}'...[/blue]")
+                self.console.print(f"[blue]Deleting {actions} '{branch}'...[/blue]")
 
             # Handle remote deletion
-            if delete_remote and self.check_network_connection():
+            if remote_exists:
                 try:
                     self.repo.git.push('origin', '--delete', branch)
+                    self._remote_heads_snapshot().pop(branch, None)
                     self.console.print(f"[green]Deleted remote branch {branch}[/green]")
                 except GitCommandError as e:
-                    if "remote ref does not exist" in str(e):
+                    if _ERR_PATTERNS["no_remote_ref"].search(str(e)):
                         pass
                     else:
+                        self.invalidate_network_cache()
                         raise
 
             # Handle local deletion
-            if delete_local and local_exists:
+            if local_exists:
                 # Only switch to develop if we're deleting the current branch locally
                 current_branch = self.repo.active_branch.name
                 if current_branch == branch:
+                    self._invalidate_status()
                     self.repo.git.checkout('develop')
 
                 self.repo.git.branch('-D', branch)
+                self._invalidate_branches()
+                self._invalidate_config()
                 self.console.print(f"[green]Deleted local branch {branch}[/green]")
 
         except GitCommandError as e:
             self.console.print(f"[yellow]Could not delete branch {branch}: {e}[/yellow]")
 
+    def delete_branches(self, branches: List[str], delete_remote=True, delete_local=True):
+        """Delete several branches locally and/or remotely.
+
+        Remote branches are removed with a single `git push --delete` and local
+        ones with a single `git branch -D`; the branch lists and the network
+        state are looked up once beforehand.
+
+        Args:
+            branches (List[str]): Names of the branches to delete
+            delete_remote (bool): Whether to delete the remote branches
+            delete_local  (bool): Whether to delete the local branches
+        """
+        if len(branches) <= 1:
+            for branch in branches:
+                self.delete_branch(branch, delete_remote=delete_remote, delete_local=delete_local)
+            return
+
+        self._branches()
+        if delete_remote and self.check_network_connection():
+            remote_heads = self._remote_heads_snapshot()
+            existing = [branch for branch in branches if branch in remote_heads]
+            if existing:
+                self.console.print(f"[blue]Deleting remote branches {', '.join(existing)}...[/blue]")
+                status, stdout, stderr = self.repo.git.push('--porcelain', 'origin', '--delete', *existing,
+                                                            with_extended_output=True, with_exceptions=False)
+                # Ref lines are `<flag>\t:refs/heads/<branch>\t<summary>`; `-` marks a deleted ref
+                deleted = set()
+                for line in stdout.splitlines():
+                    flag, _, rest = line.partition('\t')
+                    if flag == '-':
+                        deleted.add(rest.partition('\t')[0].rpartition('refs/heads/')[2])
+                rejected = {refspec.rpartition('refs/heads/')[2]: summary
+                            for refspec, summary in _push_rejections(stdout).items()}
+                for branch in existing:
+                    if branch in deleted:
+                        remote_heads.pop(branch, None)
+                        self.console.print(f"[green]Deleted remote branch {branch}[/green]")
+                    elif branch in rejected:
+                        self.console.print(f"[yellow]Could not delete remote branch {branch}: {rejected[branch]}[/yellow]")
+                if status != 0:
+                    self.invalidate_network_cache()
+                    self.invalidate_remote_snapshot()
+                    if not rejected:
+                        self.console.print(f"[yellow]Could not delete remote branches: {stderr.strip()}[/yellow]")
+        if not delete_local:
+            return
+
+        local_branches = self._branches()
+        existing = [branch for branch in branches if branch in local_branches]
+        if not existing:
+            return
+
+        # Only switch to develop if we're deleting the current branch locally
+        if not self.repo.head.is_detached and self.repo.head.ref.name in existing:
+            self._invalidate_status()
+            self.repo.git.checkout('develop')
+
+        self.console.print(f"[blue]Deleting local branches {', '.join(existing)}...[/blue]")
+        try:
+            status, _, stderr = self.repo.git.branch('-D', *existing,
+                                                     with_extended_output=True, with_exceptions=False)
+            # git deletes what it can and names every failure in its error output
+            self._invalidate_branches()
+            remaining = self._branches()
+            for branch in existing:
+                if branch not in remaining:
+                    self.console.print(f"[green]Deleted local branch {branch}[/green]")
+            if status != 0:
+                self.console.print(f"[yellow]Could not delete some local branches: {stderr.strip()}[/yellow]")
+        finally:
+            self._invalidate_branches()
+            self._invalidate_config()
+
+    def _remote_heads_snapshot(self) -> Dict[str, str]:
+        """Return the branches on origin and their commits, asking the remote with `ls-remote --heads`.
+
+        The answer is reused for NETWORK_CACHE_TTL seconds, like the network check.
+
+        Returns:
+            Dict[str, str]: Branch names mapped to the SHA-1 they point to on origin
+        """
+        now = time.monotonic()
+        if self._remote_heads is None or now - self._remote_heads[0] >= self.NETWORK_CACHE_TTL:
+            try:
+                output = self.repo.git.ls_remote('--heads', 'origin')
+            except GitCommandError:
+                return {}  # Not cached, so the next call asks again
+            heads = {}
+            for line in output.splitlines():
+                sha, _, ref = line.partition('\t')
+                if ref.startswith('refs/heads/'):
+                    heads[ref[len('refs/heads/'):]] = sha
+            self._remote_heads = (now, heads)
+        return self._remote_heads[1]
+
+    def invalidate_remote_snapshot(self):
+        """Forget the cached remote branches, e.g. after pushing or deleting branches on origin."""
+        self._remote_heads = None
+
     def checkout(self, branch, start_point=None, create=False, force=False):
         """Checkout a branch, optionally creating it or forcing the operation."""
         args = []
@@ -208,20 +577,21 @@ class GitWrapper:
             kwargs['force'] = True
 
         # Execute the git checkout command
+        self._invalidate_status()
         self.repo.git.checkout(*args, **kwargs)
+        if create:
+            self._invalidate_branches()
 
     def determine_branch_name(self, name, branch_type, week):
         """Determine the full branch name based on the type and name."""
-        if name and branch_type != "release":
-            return f"{branch_type}/{name}" if branch_type != "local" else name
-        elif branch_type == "hotfix":
-            week_number = self.get_week_number(week)
-            return f"hotfix/week-{week_number}"
-        elif branch_type == "release" and name:
-            return f"release/{name}"
+        namer = _BRANCH_NAMERS.get(branch_type)
+        if namer is not None:
+            branch_name = namer(self, name, week)
         else:
+            branch_name = f"{branch_type}/{name}" if name else None
+        if branch_name is None:
             self.console.print("[red]Error: Invalid branch configuration[/red]")
-            return None
+        return branch_name
 
     def set_branch_comment(self, branch: str, comment: str):
         """Set a comment for a specific branch.
@@ -233,6 +603,7 @@ class GitWrapper:
         config_key = f"branch.{branch}.comment"
         try:
             self.repo.git.config('--local', config_key, comment)
+            update_config(self.repo.git_dir, config_key, comment)
             self.console.print(f"[green]Comment saved for branch '{branch}'[/green]")
         except GitCommandError as e:
             self.console.print(f"[red]Failed to save comment for branch '{branch}': {e}[/red]")
@@ -246,11 +617,7 @@ class GitWrapper:
         Returns:
             Optional[str]: The comment if it exists, None otherwise
         """
-        config_key = f"branch.{branch}.comment"
-        try:
-            return self.repo.git.config('--get', config_key)
-        except GitCommandError:
-            return None
+        return self._load_config_cache().get(canonical_key(f"branch.{branch}.comment"))
 
     def get_all_branch_comments(self) -> Dict[str, str]:
         """Get all branch comments.
@@ -258,17 +625,31 @@ class GitWrapper:
         Returns:
             Dict[str, str]: A dictionary mapping branch names to their comments
         """
+        # Branch names may contain dots, so strip the fixed prefix and suffix instead of splitting
+        return {
+            key[len('branch.'):-len('.comment')]: comment
+            for key, comment in self._load_config_cache().items()
+            if key.startswith('branch.') and key.endswith('.comment') and key.count('.') >= 2
+        }
+
+    def _load_config_cache(self) -> Dict[str, str]:
+        """Return the Git config snapshot shared with GitConfig, reading it once with `git config --list -z`.
+
+        Returns:
+            Dict[str, str]: Config keys as Git reports them, mapped to their values
+        """
+        return load_config(self.repo.git_dir, self._read_config)
+
+    def _read_config(self) -> str:
+        """Run `git config --list -z`, treating an unreadable config as empty."""
         try:
-            # Get all branch.*.comment configurations
-            config_output = self.repo.git.config('--get-regexp', r'^branch\..*\.comment$')
-            comments = {}
-            for line in config_output.splitlines():
-                key, comment = line.split(' ', 1)
-                branch = key.split('.')[1]  # Extract branch name from branch.<name>.comment
-                comments[branch] = comment
-            return comments
+            return self.repo.git.config('--list', '-z')
         except GitCommandError:
-            return {}
+            return ''
+
+    def _invalidate_config(self):
+        """Drop the shared config snapshot after git changed the config behind our back."""
+        invalidate_config(self.repo.git_dir)
 
     # -----------------------------------
     # Add, Pull, Push, Fetch, and Remote Operations
@@ -285,57 +666,103 @@ class GitWrapper:
         if force:
             args.append('--force')
 
+        self._invalidate_status()
         self.repo.git.add(*args)
 
     def push(self, remote='origin', branch='develop', *args, **kwargs):
         """Push changes to the specified remote and branch, with fallback for protected branches."""
-        offline = not self.check_network_connection()
-        new_branch_name = None
+        self._invalidate_status()
+        self.invalidate_remote_snapshot()
+        self._invalidate_branches()
 
-        try:
-            self.repo.git.push(remote, branch, *args, **kwargs)
+        status, stdout, stderr = self.repo.git.push('--porcelain', remote, branch, *args,
+                                                    with_extended_output=True, with_exceptions=False, **kwargs)
+        if status == 0:
             return None  # No new branch created
-        except (GitCommandError, subprocess.CalledProcessError) as e:
-            if "protected branch" in str(e):
-                self.console.print(f"[yellow]Protected branch {branch} detected. Creating a new branch for pull request.[/yellow]")
-                new_branch_name = f"update-{branch}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
-                self.repo.git.checkout('-b', new_branch_name)
-                if not offline:
-                    self.repo.git.push('origin', new_branch_name)
-                    result = subprocess.run(
-                        ["gh", "pr", "create", "--base", branch, "--head", new_branch_name,
-                            "--title", f"Update {branch}", "--body", "Automated pull request from script"],
-                        capture_output=True, text=True
-                    )
-                    if result.returncode == 0:
-                        self.console.print(f"[green]Created pull request to merge changes from {new_branch_name} into {branch}[/green]")
-                        self.temp_branches.append(new_branch_name)
-                    else:
-                        self.console.print(f"[red]Error creating pull request: {result.stderr}[/red]")
-                else:
-                    self.console.print("[yellow]No network connection. New branch created locally. Push and create PR when online.[/yellow]")
-                    self.temp_branches.append(new_branch_name)
 
-                self.repo.git.checkout(branch)
+        # Only a ref the remote actually rejected can be a protected branch; hosts differ in
+        # whether the reason shows up in the porcelain summary or only in the remote's stderr
+        rejected = _push_rejections(stdout)
+        if rejected and (any(_ERR_PATTERNS["protected"].search(summary) for summary in rejected.values())
+                         or _ERR_PATTERNS["protected"].search(stderr)):
+            self.console.print(f"[yellow]Protected branch {branch} detected. Creating a new branch for pull request.[/yellow]")
+            new_branch_name = f"update-{branch}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            self.repo.git.checkout('-b', new_branch_name)
+            self._invalidate_branches()
+            if self.check_network_connection():
+                self.repo.git.push('origin', new_branch_name)
+                error = self._open_pull_request(branch, new_branch_name, f"Update {branch}",
+                                                "Automated pull request from script")
+                if error is None:
+                    self.console.print(f"[green]Created pull request to merge changes from {new_branch_name} into {branch}[/green]")
+                    self.temp_branches.append(new_branch_name)
+                else:
+                    self.console.print(f"[red]Error creating pull request: {error}[/red]")
             else:
-                self.console.print(f"[red]Error: {e}[/red]")
-                raise e
+                self.console.print("[yellow]No network connection. New branch created locally. Push and create PR when online.[/yellow]")
+                self.temp_branches.append(new_branch_name)
+
+            self.repo.git.checkout(branch)
+            return new_branch_name
+
+        self.invalidate_network_cache()
+        e = GitCommandError(['git', 'push', remote, branch, *args], status, stderr, stdout)
+        if not _ERR_PATTERNS["no_network"].search(stderr):
+            self.console.print(f"[red]Error: {e}[/red]")
+        raise e
+
+    def _open_pull_request(self, base: str, head: str, title: str, body: str) -> Optional[str]:
+        """Open a pull request on GitHub.
+
+        With GH_TOKEN or GITHUB_TOKEN set, the REST API is called directly over
+        a shared session; otherwise, or if that call fails, the gh CLI is used.
+
+        Args:
+            base  (str): The branch to merge into
+            head  (str): The branch holding the changes
+            title (str): The pull request title
+            body  (str): The pull request description
 
-        return new_branch_name
+        Returns:
+            Optional[str]: None on success, otherwise the error message
+        """
+        token = os.environ.get('GH_TOKEN') or os.environ.get('GITHUB_TOKEN')
+        match = _GITHUB_REPO_RE.search(self.get_remote_url()) if token else None
+        if match:
+            owner, repo = match.groups()
+            try:
+                response = _get_github_session(token).post(
+                    f"https://api.github.com/repos/{owner}/{repo}/pulls",
+                    json={'title': title, 'head': head, 'base': base, 'body': body},
+                    timeout=30
+                )
+                if response.status_code == 201:
+                    return None
+            except (ImportError, OSError):
+                pass  # requests missing or the request failed; fall back to the gh CLI below
+
+        result = subprocess.run(
+            ["gh", "pr", "create", "--base", base, "--head", head, "--title", title, "--body", body],
+            capture_output=True, text=True
+        )
+        return None if result.returncode == 0 else result.stderr
 
     def push_to_remote(self, branch):
-        """Push changes to the remote repository, with offline mode handling."""
-        offline = not self.check_network_connection()
-        if offline:
-            self.console.print("[yellow]Offline mode. Changes will be pushed when online.[/yellow]")
-            return True
+        """Push changes to the remote repository, with offline mode handling.
 
+        The push itself tells whether the remote is reachable, so no separate
+        connectivity probe runs beforehand.
+        """
         try:
             self.push('origin', branch)
             self.console.print(f"[green]Pushed changes to {branch}[/green]")
             return True
-        except GitCommandError as e:
-            if "up-to-date" in str(e):
+        except (GitCommandError, subprocess.CalledProcessError) as e:
+            msg = str(e)
+            if _ERR_PATTERNS["no_network"].search(msg):
+                self.console.print("[yellow]Offline mode. Changes will be pushed when online.[/yellow]")
+                return True
+            if _ERR_PATTERNS["uptodate"].search(msg):
                 return False
             self.console.print(f"[red]Error pushing to remote: {e}[/red]")
             return False
@@ -355,6 +782,9 @@ class GitWrapper:
         if rebase:
             pull_args.insert(2, '--rebase')
 
+        # Pull fetches too, so remote-tracking refs move along with the working tree
+        self._invalidate_status()
+        self._invalidate_branches()
         try:
             return self.repo.git.execute(pull_args)
         except GitCommandError as e:
@@ -368,14 +798,25 @@ class GitWrapper:
             args.append('--all')
         if prune:
             args.append('--prune')
-        if branch:
-            self.repo.git.fetch(remote, branch, *args)
-        else:
-            self.repo.git.fetch(remote, *args)
+        self._invalidate_branches()
+        try:
+            if all_remotes:
+                # `git fetch --all` does not accept a repository argument
+                self.repo.git.fetch(*args)
+            elif branch:
+                self.repo.git.fetch(remote, branch, *args)
+            else:
+                self.repo.git.fetch(remote, *args)
+        except GitCommandError:
+            self.invalidate_network_cache()
+            raise
 
     def remote(self, command, *args):
         """Execute git remote commands like 'prune', 'add', or 'remove'."""
         cmd_args = [command] + list(args)
+        if command in _REMOTE_MUTATIONS:
+            self._remotes_cache = None
+            self._net_endpoint, self._net_endpoint_resolved = None, False
         return self.repo.git.remote(*cmd_args)
 
 
@@ -401,6 +842,7 @@ class GitWrapper:
             if branch:
                 args.append(branch)
 
+        self._invalidate_status()
         self.repo.git.merge(*args)
 
     def merge_base(self, base_branch, compare_branch):
@@ -410,6 +852,7 @@ class GitWrapper:
     def merge_to_target(self, source, target, no_ff=True):
         """Merge the source branch into the target branch and push the changes."""
         self.console.print(f"[blue]Merging {source} into {target}...[/blue]")
+        self._invalidate_status()
         try:
             self.repo.git.checkout(target)
             merge_args = [source]
@@ -428,10 +871,12 @@ class GitWrapper:
 
     def reset(self, mode='mixed', commit='HEAD'):
         """Reset the current HEAD to the specified state."""
+        self._invalidate_status()
         self.repo.git.reset(mode, commit)
 
     def abort_merge(self):
         """Abort the current merge process."""
+        self._invalidate_status()
         self.repo.git.merge('--abort')
 
     def rebase(self, upstream, branch=None):
@@ -439,6 +884,7 @@ class GitWrapper:
         args = ['rebase', upstream]
         if branch:
             args.append(branch)
+        self._invalidate_status()
         self.repo.git.execute(args)
 
 
@@ -461,6 +907,7 @@ class GitWrapper:
         if command in ['list', 'show']:
             return self.repo.git.stash(*cmd_args)
         else:
+            self._invalidate_status()
             self.repo.git.stash(*cmd_args)
 
     def get_stashed_changes(self):
@@ -475,39 +922,104 @@ class GitWrapper:
         """Get the status of the working directory."""
         return self.repo.git.status(*args, **kwargs)
 
-    def get_diff(self, start=None, end=None):
-        """Get the diff between two commits or for the working directory."""
-        if start is None:
-            # Get diff of unstaged changes
-            return self.repo.git.diff()
-        elif end is None:
-            if '..' in start:
-                # Handle the case where the range is passed as a single argument
-                return self.repo.git.diff(start)
-            else:
-                # Handle the case where only one argument is provided (e.g., '--cached')
-                return self.repo.git.diff(start)
-        else:
-            return self.repo.git.diff(start, end)
-
     def is_dirty(self, untracked_files=True):
         """Check if the working directory has uncommitted changes."""
-        return self.repo.is_dirty(untracked_files=untracked_files)
+        if not untracked_files and self._status_cache is None:
+            # Tracked changes alone are answered by git's exit code without listing any files
+            returncode = self._run_git(["diff", "--quiet", "HEAD", "--"]).returncode
+            if returncode in (0, 1):
+                return returncode == 1
+        snapshot = self.get_status_snapshot()
+        if snapshot['staged'] or snapshot['modified']:
+            return True
+        return untracked_files and bool(snapshot['untracked'])
+
+    def has_uncommitted_changes(self, path: Optional[str] = None) -> bool:
+        """Check for staged, unstaged or untracked changes, optionally below a path.
+
+        Answered from the status snapshot, so checking many paths costs a single
+        git status call.
+
+        Args:
+            path (Optional[str]): A file or directory relative to the repository root
+
+        Returns:
+            bool: True if anything at or below the path has changed
+        """
+        snapshot = self.get_status_snapshot()
+        if path is None:
+            return any(snapshot.values())
+        path = path.rstrip('/')
+        prefix = f"{path}/"
+        return any(p == path or p.startswith(prefix) for paths in snapshot.values() for p in paths)
+
+    def get_status_snapshot(self) -> Dict[str, List[str]]:
+        """Collect staged, modified and untracked files with a single git status call.
+
+        The snapshot is shared by later calls until a mutating operation runs or
+        STATUS_CACHE_TTL seconds have passed.
+
+        Returns:
+            Dict[str, List[str]]: Paths under the keys 'staged', 'modified' and 'untracked'
+        """
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_cache[0] < self.STATUS_CACHE_TTL:
+            return self._status_cache[1]
+
+        snapshot = {'staged': [], 'modified': [], 'untracked': []}
+        # Parsed as bytes so that only the paths are decoded, the way the OS would name them
+        output = self.repo.git.status('--porcelain=v2', '-z', '--untracked-files=all', stdout_as_string=False)
+        records = iter(output.split(b'\0'))
+        for record in records:
+            kind = record[:1]
+            if kind == b'?':
+                snapshot['untracked'].append(os.fsdecode(record[2:]))
+                continue
+            if kind == b'1':
+                fields = record.split(b' ', 8)
+            elif kind == b'2':
+                fields = record.split(b' ', 9)
+                next(records, None)  # Skip the original path of a rename or copy
+            elif kind == b'u':
+                fields = record.split(b' ', 10)
+            else:
+                continue
+
+            xy, path = fields[1], os.fsdecode(fields[-1])
+            if kind == b'u':
+                snapshot['modified'].append(path)
+                continue
+            if xy[:1] != b'.':
+                snapshot['staged'].append(path)
+            if xy[1:2] != b'.':
+                snapshot['modified'].append(path)
+        self._status_cache = (now, snapshot)
+        return snapshot
+
+    def _invalidate_status(self):
+        """Drop the cached status snapshot before an operation that changes the working tree or index."""
+        self._status_cache = None
+        self._rev_parse_cache.clear()
+        self._branch_statuses_cache = None
 
     def get_untracked_files(self):
         """Get a list of untracked files."""
-        return self.repo.untracked_files
+        return list(self.get_status_snapshot()['untracked'])
 
     def get_modified_files(self):
         """Get a list of modified but unstaged files."""
-        return [item.a_path for item in self.repo.index.diff(None)]
+        return list(self.get_status_snapshot()['modified'])
 
     def get_staged_files(self):
         """Get a list of files that are staged for commit."""
-        return [item.a_path for item in self.repo.index.diff('HEAD')]
+        return list(self.get_status_snapshot()['staged'])
 
-    def get_commits(self, start=None, end='HEAD', max_count=None, since=None):
-        """Get a list of commits in the specified range."""
+    def get_commits(self, start=None, end='HEAD', max_count=None, since=None) -> Iterator[Commit]:
+        """Iterate over the commits in the specified range.
+
+        Commits are streamed from `git rev-list` as they are read, so callers that
+        stop early or only need one pass do not materialise the whole history.
+        """
         args = []
         if max_count:
             args.extend(['-n', str(max_count)])
@@ -517,31 +1029,120 @@ class GitWrapper:
             args.append(f"{start}..{end}")
         else:
             args.append(end)
-        return list(self.repo.iter_commits(*args))
-
-    def get_diff(self, start=None, end=None):
-        """Get the diff between two commits or the current working directory."""
-        if start is None:
-            return self.repo.git.diff()
-        elif end is None:
-            if '..' in start:
-                return self.repo.git.diff(start)
-            else:
-                return self.repo.git.diff(start)
-        else:
-            return self.repo.git.diff(start, end)
+        return self.repo.iter_commits(*args)
+
+    def get_diff(self, start=None, end=None, as_bytes=False) -> Union[str, bytes]:
+        """Get the diff between two commits or the current working directory.
+
+        Args:
+            start    (str): The first commit, a range, or an option such as '--cached'
+            end      (str): The second commit
+            as_bytes (bool): Return the raw output without decoding it, which is
+                             cheaper for large diffs that are only written out again
+
+        Returns:
+            Union[str, bytes]: The diff output
+        """
+        return self.repo.git.diff(*self._diff_args(start, end), stdout_as_string=not as_bytes)
+
+    @staticmethod
+    def _diff_args(start=None, end=None) -> List[str]:
+        """Build the revision arguments for git diff from an optional start and end."""
+        return [arg for arg in (start, end) if arg is not None]
+
+    def iter_diff(self, start=None, end=None, chunk_size=65536) -> Iterator[str]:
+        """Stream a diff in chunks instead of holding the whole patch in memory.
+
+        Args:
+            start      (str): The first commit, a range, or an option such as '--cached'
+            end        (str): The second commit
+            chunk_size (int): The number of bytes read from git per chunk
+
+        Yields:
+            str: Consecutive pieces of the diff output
+        """
+        diff_args = self._diff_args(start, end)
+        process = self.repo.git.diff(*diff_args, as_process=True)
+        completed = False
+        try:
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            for chunk in iter(lambda: process.stdout.read(chunk_size), b''):
+                yield decoder.decode(chunk)
+            tail = decoder.decode(b'', final=True)
+            if tail:
+                yield tail
+            completed = True
+        finally:
+            _end_stream(process, ['git', 'diff', *diff_args], completed)
+
+    def diff_stat(self, start=None, end=None) -> List[Tuple[Optional[int], Optional[int], str]]:
+        """List the changed files with their added and deleted line counts.
+
+        Uses `git diff --numstat -z`, which is far smaller than the patch itself.
+
+        Args:
+            start (str): The first commit, a range, or an option such as '--cached'
+            end   (str): The second commit
+
+        Returns:
+            List[Tuple[Optional[int], Optional[int], str]]: (added, deleted, path) per file,
+                with None counts for binary files and the new path for renames
+        """
+        output = self.repo.git.diff('--numstat', '-z', *self._diff_args(start, end))
+        fields = iter(output.split('\0'))
+        stats = []
+        for field in fields:
+            if not field:
+                continue
+            added, deleted, path = field.split('\t', 2)
+            if not path:
+                # Renames and copies carry the old and new path as separate fields
+                next(fields, None)
+                path = next(fields, '')
+            stats.append((
+                int(added) if added != '-' else None,
+                int(deleted) if deleted != '-' else None,
+                path
+            ))
+        return stats
 
     def get_index_diff(self, branch):
         """Get the diff between the index and the specified branch."""
         return self.repo.index.diff(branch)
 
     def rev_parse(self, rev):
-        """Return the SHA-1 hash of the given revision."""
+        """Return the SHA-1 hash of the given revision.
+
+        Revisions are resolved in-process by GitPython where possible; git itself
+        is only asked for syntax GitPython does not understand. Object names
+        are remembered, since they cannot point anywhere else later. Symbolic
+        revisions are remembered until a mutating operation runs or
+        STATUS_CACHE_TTL seconds have passed.
+        """
+        if rev in self._sha_cache:
+            return self._sha_cache[rev]
+        now = time.monotonic()
+        cached = self._rev_parse_cache.get(rev)
+        if cached is not None and now - cached[0] < self.STATUS_CACHE_TTL:
+            return cached[1]
+
         try:
-            return self.repo.git.rev_parse(rev).strip()
-        except GitCommandError as e:
-            self.console.print(f"[red]Error: {e}[/red]")
-            return None
+            hexsha = self.repo.rev_parse(rev).hexsha
+        except (BadName, BadObject, ValueError, IndexError, NotImplementedError):
+            hexsha = None
+
+        if hexsha is None:
+            try:
+                hexsha = self.repo.git.rev_parse(rev).strip()
+            except GitCommandError as e:
+                self.console.print(f"[red]Error: {e}[/red]")
+                return None
+
+        if _SHA_RE.match(rev) and hexsha.startswith(rev):
+            self._sha_cache[rev] = hexsha
+        else:
+            self._rev_parse_cache[rev] = (now, hexsha)
+        return hexsha
 
     def rev_list(self, *args):
         """List commit objects in reverse chronological order."""
@@ -553,27 +1154,75 @@ class GitWrapper:
 
     def cleanup_temp_branches(self):
         """Cleanup temporary branches created during operations."""
-        for branch in self.temp_branches:
-            self.delete_branch(branch, delete_remote=False)
+        self.delete_branches(self.temp_branches, delete_remote=False)
         self.temp_branches = []
+        self._invalidate_config()
 
     # -----------------------------------
     # Utility Methods
     # -----------------------------------
 
     def check_network_connection(self):
-        """Check if there is a network connection by trying to reach the remote."""
-        try:
-            self.repo.git.ls_remote('--exit-code', '--quiet', 'origin')
-            return True
-        except GitCommandError:
-            return False
+        """Check if there is a network connection by trying to reach the remote.
+
+        For network remotes a TCP connection to origin's host is tried first, and
+        success counts as online. If that fails, or for other remotes, git itself
+        is asked with `git ls-remote`, since SSH host aliases and proxies can make
+        the remote reachable for git but not for a direct connection. The result
+        is reused for NETWORK_CACHE_TTL seconds so that repeated checks within one
+        operation only reach the remote once.
+        """
+        now = time.monotonic()
+        if self._net_cache is not None and now - self._net_cache[0] < self.NETWORK_CACHE_TTL:
+            return self._net_cache[1]
+
+        online = False
+        endpoint = self._remote_endpoint()
+        if endpoint is not None:
+            try:
+                with socket.create_connection(endpoint, timeout=1.0):
+                    online = True
+            except OSError:
+                pass
+        if not online:
+            try:
+                self.repo.git.ls_remote('--exit-code', '--quiet', 'origin')
+                online = True
+            except GitCommandError:
+                online = False
+        self._net_cache = (now, online)
+        return online
+
+    def _remote_endpoint(self) -> Optional[Tuple[str, int]]:
+        """Return the host and port behind origin's URL, or None if it is not a network URL."""
+        if not self._net_endpoint_resolved:
+            self._net_endpoint_resolved = True
+            try:
+                url = self.get_remote_url('origin')
+            except (IndexError, ValueError):
+                return None
+
+            default_ports = {'https': 443, 'http': 80, 'ssh': 22, 'git': 9418}
+            parsed = urlparse(url)
+            if parsed.scheme in default_ports and parsed.hostname:
+                self._net_endpoint = (parsed.hostname, parsed.port or default_ports[parsed.scheme])
+            elif '://' not in url and ':' in url.split('/', 1)[0]:
+                # scp-like syntax: [user@]host:path (a single letter is a Windows drive)
+                host = url.split(':', 1)[0].rpartition('@')[2]
+                if len(host) > 1:
+                    self._net_endpoint = (host, 22)
+        return self._net_endpoint
+
+    def invalidate_network_cache(self):
+        """Forget the cached network state so the next check probes the remote again."""
+        self._net_cache = None
 
     def get_week_number(self, week: Optional[int] = None) -> str:
         """Get the current week number in the format YYYY-WW."""
+        now = datetime.now()
         if week is None:
-            week = datetime.now().isocalendar()[1]
-        return f"{datetime.now().year}-{week:02}"
+            week = now.isocalendar()[1]
+        return f"{now.year}-{week:02}"
 
     def get_origin_refs(self):
         """Get references to all branches and tags from the origin remote."""
@@ -581,14 +1230,23 @@ class GitWrapper:
 
     def cherry_pick(self, commit):
         """Cherry-pick a specific commit onto the current branch."""
+        self._invalidate_status()
         self.repo.git.cherry_pick(commit)
 
     def revert(self, commit):
         """Revert a specific commit."""
+        self._invalidate_status()
         self.repo.git.revert(commit)
 
     def execute_git_command(self, cmd):
         """Execute a git command and return its output."""
+        # An arbitrary command may change the working tree, refs, remotes or config
+        self._invalidate_status()
+        self._invalidate_branches()
+        self._invalidate_config()
+        self._remotes_cache = None
+        self._net_endpoint, self._net_endpoint_resolved = None, False
+        self.invalidate_remote_snapshot()
         try:
             return self.repo.git.execute(['git'] + cmd)
         except GitCommandError as e:
@@ -602,6 +1260,24 @@ class GitWrapper:
             self.console.print(f"[red]Error executing git log: {e}[/red]")
             raise
 
+    def log_stream(self, *args) -> Iterator[str]:
+        """Stream git log output line by line instead of collecting it into one string.
+
+        Args:
+            *args: Variable arguments to pass to git log command
+
+        Yields:
+            str: Each output line without its trailing newline
+        """
+        process = self.repo.git.log(*args, as_process=True)
+        completed = False
+        try:
+            for line in iter(process.stdout.readline, b''):
+                yield line.rstrip(b'\n').decode('utf-8', errors='replace')
+            completed = True
+        finally:
+            _end_stream(process, ['git', 'log', *args], completed)
+
     def show(self, *args):
         """Show various git objects (commits, files at specific revisions, etc).
 
@@ -615,8 +1291,51 @@ class GitWrapper:
             show('HEAD:file.txt') - Shows contents of file.txt at HEAD
             show('abc123') - Shows commit abc123
         """
+        # A single `<rev>:<path>` naming a file is served from the cat-file pipe without spawning git
+        if len(args) == 1 and ':' in args[0] and not args[0].startswith('-'):
+            try:
+                _, obj_type, data = self.cat_object(args[0])
+                if obj_type == 'blob':
+                    if data.endswith(b'\n'):
+                        data = data[:-1]
+                    return data.decode('utf-8', errors='replace')
+            except ValueError:
+                pass  # Let git show report unknown objects as before
+
         try:
             return self.repo.git.show(*args)
         except GitCommandError as e:
             self.console.print(f"[red]Error executing git show: {e}[/red]")
             raise
+
+    def cat_object(self, spec: str) -> Tuple[str, str, bytes]:
+        """Read an object through the long-running `git cat-file --batch` process.
+
+        Args:
+            spec (str): Any object name git understands, e.g. 'HEAD' or 'main:README.md'
+
+        Returns:
+            Tuple[str, str, bytes]: The object's SHA-1, its type and its raw content
+
+        Raises:
+            ValueError: If the object cannot be resolved
+        """
+        hexsha, obj_type, _, data = self.repo.git.get_object_data(spec)
+        if isinstance(hexsha, bytes):
+            hexsha, obj_type = hexsha.decode('ascii'), obj_type.decode('ascii')
+        return hexsha, obj_type, data
+
+    def read_blob(self, rev: str, path: str) -> bytes:
+        """Read the content of a file at a given revision.
+
+        Args:
+            rev  (str): The revision to read from
+            path (str): The path of the file relative to the repository root
+
+        Returns:
+            bytes: The raw file content
+
+        Raises:
+            ValueError: If the revision or path does not exist
+        """
+        return self.cat_object(f"{rev}:{path}")[2]
@@ -2,20 +2,22 @@
 This module provides functionality for generating documentation from GitHub issues.
 """
 
-from typing import List, Dict, Optional, Set
+from typing import Callable, List, Dict, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
 import re
+import time
 from dataclasses import dataclass
 import json
 import subprocess
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.console import Console
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 import markdown
 from bs4 import BeautifulSoup
 from docx.oxml.shared import OxmlElement, qn
-from .docstyles import apply_styles_to_document
+from .docstyles import apply_styles_to_document, _px
+from .console import get_console
 import os
 import docx.opc
 import docx.opc.constants
@@ -27,7 +29,28 @@ import certifi
 import tempfile
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-console = Console()
+
+# Concurrent issue fetches; GitHub's secondary rate limits punish much more than this
+_MAX_API_WORKERS = 8
+# Attempts for a rate-limited API request before giving up
+_MAX_API_ATTEMPTS = 3
+
+
+def _parallel_map(fn: Callable, items: List, max_workers: int = _MAX_API_WORKERS) -> List:
+    """Apply an I/O-bound function to every item concurrently.
+
+    Args:
+        fn          (Callable): The function to call with each item
+        items           (List): The items to process
+        max_workers      (int): The maximum number of concurrent calls
+
+    Returns:
+        List: The results in the order of the items
+    """
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(fn, items))
 
 @dataclass
 class IssueContent:
@@ -50,25 +73,104 @@ class IssueDocGenerator:
         self.bookmarks: Dict[int, str] = {}  # Track bookmarks for each issue
 
         # Get repo URL for links
+        name_with_owner = None
         try:
             result = subprocess.run(
-                ["gh", "repo", "view", "--json", "url"],
+                ["gh", "repo", "view", "--json", "url,nameWithOwner"],
                 capture_output=True, text=True, check=True
             )
-            self.repo_url = json.loads(result.stdout)['url']
+            repo_data = json.loads(result.stdout)
+            self.repo_url = repo_data['url']
+            name_with_owner = repo_data['nameWithOwner']
         except subprocess.CalledProcessError:
-            console.print("[yellow]Warning: Could not get repository URL. Links will be disabled.[/yellow]")
+            get_console().print("[yellow]Warning: Could not get repository URL. Links will be disabled.[/yellow]")
             self.repo_url = None
 
+        # Talk to the REST API over one keep-alive session instead of starting gh per issue
+        self.api_url = None
+        self.session = None
+        token = self._get_auth_token() if name_with_owner else None
+        if token:
+            host = urlparse(self.repo_url).hostname
+            api_root = "https://api.github.com" if host == "github.com" else f"https://{host}/api/v3"
+            self.api_url = f"{api_root}/repos/{name_with_owner}"
+            self.session = requests.Session()
+            self.session.headers.update({
+                'Accept': 'application/vnd.github+json',
+                'Authorization': f'Bearer {token}',
+                'X-GitHub-Api-Version': '2022-11-28',
+            })
+
         # Get path to styles.css relative to this module
         module_dir = os.path.dirname(os.path.abspath(__file__))
         self.css_path = os.path.join(module_dir, 'styles.css')
-        console.print(f"[blue]Looking for styles.css at: {self.css_path}[/blue]")
+        get_console().print(f"[blue]Looking for styles.css at: {self.css_path}[/blue]")
 
         if not os.path.exists(self.css_path):
-            console.print(f"[red]Warning: Could not find styles.css at {self.css_path}[/red]")
+            get_console().print(f"[red]Warning: Could not find styles.css at {self.css_path}[/red]")
         else:
-            console.print(f"[green]Found styles.css at {self.css_path}[/green]")
+            get_console().print(f"[green]Found styles.css at {self.css_path}[/green]")
+
+    @staticmethod
+    def _get_auth_token() -> Optional[str]:
+        """Get a GitHub token from the environment or, failing that, from the gh CLI."""
+        token = os.environ.get('GH_TOKEN') or os.environ.get('GITHUB_TOKEN')
+        if token:
+            return token
+        try:
+            result = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True, check=True)
+            return result.stdout.strip() or None
+        except (subprocess.CalledProcessError, OSError):
+            return None
+
+    def _api_get(self, path: str, paginate: bool = False):
+        """Fetch a REST API resource through the shared session.
+
+        Args:
+            path      (str): The path below the repository's API URL
+            paginate (bool): Follow the Link headers and concatenate all pages of a list
+
+        Returns:
+            The decoded JSON response
+        """
+        response = self._api_request(f"{self.api_url}/{path}")
+        if not paginate:
+            return response.json()
+        items = response.json()
+        while 'next' in response.links:
+            response = self._api_request(response.links['next']['url'])
+            items.extend(response.json())
+        return items
+
+    def _api_request(self, url: str) -> requests.Response:
+        """GET a URL through the shared session, waiting out rate limits.
+
+        Args:
+            url (str): The full API URL
+
+        Returns:
+            requests.Response: The successful response
+
+        Raises:
+            requests.RequestException: If the request fails or stays rate limited
+        """
+        for attempt in range(_MAX_API_ATTEMPTS):
+            response = self.session.get(url, timeout=30)
+            rate_limited = response.status_code == 429 or (
+                response.status_code == 403 and
+                ('Retry-After' in response.headers or response.headers.get('X-RateLimit-Remaining') == '0')
+            )
+            if not rate_limited or attempt == _MAX_API_ATTEMPTS - 1:
+                break
+            if 'Retry-After' in response.headers:
+                delay = float(response.headers['Retry-After'])
+            elif 'X-RateLimit-Reset' in response.headers:
+                delay = float(response.headers['X-RateLimit-Reset']) - time.time()
+            else:
+                delay = 2 ** attempt
+            time.sleep(min(max(delay, 1.0), 60.0))
+        response.raise_for_status()
+        return response
 
     def _extract_issue_numbers(self, text: str) -> List[int]:
         """Extract issue numbers from text using regex."""
@@ -76,30 +178,47 @@ class IssueDocGenerator:
         return [int(match.group(1)) for match in matches]
 
     def _get_issue(self, number: int, progress, task_id, include_comments: bool = False) -> Optional[IssueContent]:
-        """Fetch issue content using gh CLI."""
+        """Fetch issue content through the REST API, or the gh CLI without a token."""
         if number in self.issues_cache:
             return self.issues_cache[number]
 
+        if self.session is not None:
+            try:
+                progress.update(task_id, description=f"[blue]Fetching issue #{number}...")
+                data = self._api_get(f"issues/{number}")
+                comments = None
+                if include_comments:
+                    # Keep the shape gh reports, which the rendering code expects
+                    comments = [
+                        {'author': {'login': (c.get('user') or {}).get('login', '')},
+                         'body': c.get('body') or '', 'createdAt': c.get('created_at')}
+                        for c in self._api_get(f"issues/{number}/comments?per_page=100", paginate=True)
+                    ]
+                body = data.get('body') or ''
+                issue = IssueContent(
+                    number=data['number'],
+                    title=data['title'],
+                    description=body,
+                    children=self._extract_issue_numbers(body),
+                    comments=comments
+                )
+                self.issues_cache[number] = issue
+                return issue
+            except requests.RequestException:
+                pass  # Let the gh CLI below try, and report, as before
+
         try:
             progress.update(task_id, description=f"[blue]Fetching issue #{number}...")
 
-            # Fetch basic issue data
+            # Fetch the issue data, and its comments if requested, in one gh call
+            fields = "number,title,body,comments" if include_comments else "number,title,body"
             result = subprocess.run(
-                ["gh", "issue", "view", str(number), "--json", "number,title,body"],
+                ["gh", "issue", "view", str(number), "--json", fields],
                 capture_output=True, text=True, check=True
             )
             data = json.loads(result.stdout)
             children = self._extract_issue_numbers(data['body'])
-
-            # Fetch comments if requested
-            comments = None
-            if include_comments:
-                result = subprocess.run(
-                    ["gh", "issue", "view", str(number), "--json", "comments"],
-                    capture_output=True, text=True, check=True
-                )
-                comments_data = json.loads(result.stdout)
-                comments = comments_data.get('comments', [])
+            comments = data.get('comments', []) if include_comments else None
 
             issue = IssueContent(
                 number=data['number'],
@@ -113,7 +232,7 @@ class IssueDocGenerator:
             return issue
 
         except subprocess.CalledProcessError:
-            console.print(f"[red]Failed to fetch issue #{number}[/red]")
+            get_console().print(f"[red]Failed to fetch issue #{number}[/red]")
             return None
 
     def _apply_heading_style(self, paragraph, level):
@@ -296,7 +415,7 @@ class IssueDocGenerator:
 
         # Apply font size
         if 'font-size' in code_props:
-            size = int(re.match(r'(\d+)px', code_props['font-size']).group(1))
+            size = _px(code_props['font-size'])
             run.font.size = Pt(size)
 
         # Apply background color
@@ -310,19 +429,19 @@ class IssueDocGenerator:
         pPr = paragraph._element.get_or_add_pPr()
 
         if 'margin-left' in code_props:
-            margin = int(re.match(r'(\d+)px', code_props['margin-left']).group(1))
+            margin = _px(code_props['margin-left'])
             ind = pPr.get_or_add_ind()
             ind.set(qn('w:left'), str(margin * 20))
 
         if 'padding' in code_props:
-            padding = int(re.match(r'(\d+)px', code_props['padding']).group(1))
+            padding = _px(code_props['padding'])
             spacing = pPr.get_or_add_spacing()
             spacing.set(qn('w:before'), str(padding * 20))
             spacing.set(qn('w:after'), str(padding * 20))
 
         # Apply line spacing
         if 'line-height' in code_props:
-            height = int(re.match(r'(\d+)px', code_props['line-height']).group(1))
+            height = _px(code_props['line-height'])
             spacing = pPr.get_or_add_spacing()
             spacing.set(qn('w:line'), str(height * 20))
             spacing.set(qn('w:lineRule'), 'exact')
@@ -354,7 +473,7 @@ class IssueDocGenerator:
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TaskProgressColumn(),
-            console=console
+            console=get_console()
         ) as progress:
             # First, fetch all issues and create bookmarks
             fetch_task = progress.add_task("[blue]Fetching issues...", total=None)
@@ -369,24 +488,36 @@ class IssueDocGenerator:
 
     def _fetch_all_issues(self, root_issue: int, max_depth: int, max_issues: Optional[int],
                          progress, task_id, include_comments: bool = False):
-        """Fetch all issues first to ensure we have complete data."""
-        issues_to_fetch = [(root_issue, 0)]  # (issue_number, depth)
+        """Fetch all issues first to ensure we have complete data.
+
+        The tree is walked breadth first, and the issues of one level are
+        fetched concurrently; which issues are fetched matches a one-by-one walk.
+        """
+        level = [root_issue]
+        current_depth = 0
         fetched_issues = set()
 
-        while issues_to_fetch and (max_issues is None or len(fetched_issues) < max_issues):
-            current_issue, current_depth = issues_to_fetch.pop(0)  # Use FIFO order
-            if current_issue not in fetched_issues:
-                issue = self._get_issue(current_issue, progress, task_id, include_comments)
-                if issue:
-                    fetched_issues.add(current_issue)
-                    # Create a temporary paragraph to add bookmark
-                    self.bookmarks[current_issue] = f'issue_{current_issue}'
-
-                    # Add child issues to fetch queue if within depth
-                    if current_depth < max_depth:
-                        for child in issue.children:
-                            if child not in fetched_issues:
-                                issues_to_fetch.append((child, current_depth + 1))
+        def fetch(number):
+            return self._get_issue(number, progress, task_id, include_comments)
+
+        while level and (max_issues is None or len(fetched_issues) < max_issues):
+            next_level = []
+            pending = [number for number in dict.fromkeys(level) if number not in fetched_issues]
+            while pending and (max_issues is None or len(fetched_issues) < max_issues):
+                # Never request more issues than the limit still allows
+                batch_size = len(pending) if max_issues is None else max_issues - len(fetched_issues)
+                batch, pending = pending[:batch_size], pending[batch_size:]
+                for current_issue, issue in zip(batch, _parallel_map(fetch, batch)):
+                    if issue:
+                        fetched_issues.add(current_issue)
+                        # Create a temporary paragraph to add bookmark
+                        self.bookmarks[current_issue] = f'issue_{current_issue}'
+
+                        # Add child issues to fetch queue if within depth
+                        if current_depth < max_depth:
+                            next_level.extend(child for child in issue.children if child not in fetched_issues)
+            level = next_level
+            current_depth += 1
 
         progress.update(task_id, description=f"[blue]Fetched {len(fetched_issues)} issues")
 
@@ -447,7 +578,7 @@ class IssueDocGenerator:
             paragraph.paragraph_format.space_after = Pt(12)
 
         except Exception as e:
-            console.print(f"[red]Failed to add image from {image_url}: {str(e)}[/red]")
+            get_console().print(f"[red]Failed to add image from {image_url}: {str(e)}[/red]")
             # Add a placeholder text for failed images
             para = doc.add_paragraph(f"[Image could not be loaded: {image_url}]")
             para.italic = True
@@ -382,7 +382,7 @@ from rich import box, pretty, print, traceback
 from rich.console import Console
 from rich.table import Table
 from rich.text import Text
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import glob
 import math
 import json
@@ -403,8 +403,9 @@ import subprocess
 import os
 
 # Local imports
-from client import AIClient, GitConfig, DocGenerator, GitWrapper
-from client.issuedoc import IssueDocGenerator
+# GitWrapper is needed by every command; the other client classes are imported
+# by the commands that use them, so their dependencies load only when needed
+from client import GitWrapper
 
 pretty.install()
 traceback.install()
@@ -493,6 +494,18 @@ def has_differences(base_branch: str, compare_branch: str):
         return True  # Assume there are differences if we can't check
 
 
+# Count Commits Ahead of and Behind origin
+def ahead_behind_remote(branch: str, local: str = 'HEAD') -> Tuple[int, int]:
+    # A branch that tracks origin/<branch> already carries the counts in its upstream information,
+    # read for all branches at once; anything else needs its own graph walk
+    if local in ('HEAD', branch) and (local == branch or git_wrapper.get_current_branch() == branch):
+        status = git_wrapper.get_branch_status(branch)
+        if status and status['upstream'] == f'origin/{branch}' and not status['gone']:
+            return status['ahead'], status['behind']
+    behind, ahead = map(int, git_wrapper.rev_list('--left-right', '--count', f'origin/{branch}...{local}').split())
+    return ahead, behind
+
+
 # Create pull requests
 def create_pull_request(base_branch: str, branch_name: str, branch_type: str):
     force_create = branch_type == "release"
@@ -559,6 +572,7 @@ def config_ai(
     ```
 
     """
+    from client import GitConfig
     git_config = GitConfig()
     available_providers = git_config.get_available_providers()
 
@@ -752,7 +766,7 @@ def start(
                 console.print(f"[yellow]Skipping pull from {base_branch} due to offline mode.[/yellow]")
 
         # Check if the branch already exists
-        if branch_name in git_wrapper.get_branches():
+        if git_wrapper.has_local_branch(branch_name):
             git_wrapper.checkout(branch_name)
             console.print(f"[yellow]Switched to existing branch {branch_name}[/yellow]")
         else:
@@ -891,7 +905,7 @@ def weekly_update(
         original_branch = git_wrapper.get_current_branch()
 
         # Ensure the weekly-updates branch is checked out, fetch it if necessary
-        if weekly_branch not in git_wrapper.get_branches():
+        if not git_wrapper.has_local_branch(weekly_branch):
             git_wrapper.fetch('origin', weekly_branch)
             git_wrapper.checkout(weekly_branch, start_point=f'origin/{weekly_branch}', create=True)
         else:
@@ -975,11 +989,10 @@ def cds_update(
         subprocess.run(['rm', '-rf', local], check=True)
         subprocess.run(['git', 'clone', remote, local], check=True)
         subprocess.run(['rm', '-rf', os.path.join(local, '.git')], check=True)
-        subprocess.run(['git', 'add', local], check=True)
+        git_wrapper.add(os.path.relpath(os.path.abspath(local), git_wrapper.get_repo_root()))
 
         # Step 2: Check for changes and commit
-        status = subprocess.run(['git', 'status', '--porcelain'], capture_output=True, text=True, check=True).stdout
-        if not status.strip():
+        if not git_wrapper.has_uncommitted_changes():
             console.print("[yellow]No changes to commit.[/yellow]")
             return
 
@@ -1084,7 +1097,7 @@ def update(
             if not offline:
                 # Create a pull request to merge develop into main
                 console.print(f"[yellow]Creating pull request to merge develop into main.[/yellow]")
-                pr_created = git_wrapper.create_pull_request('main', 'develop', "update")
+                pr_created = create_pull_request('main', 'develop', "update")
                 if pr_created:
                     console.print(f"[green]Pull request created to merge develop into main.[/green]")
                 else:
@@ -1167,7 +1180,7 @@ def checkout(
     try:
         if target is None:
             # Interactive branch selection
-            local_branches = [f"Local : {head.name}" for head in git_wrapper.get_heads()]
+            local_branches = [f"Local : {name}" for name in git_wrapper.get_local_branches()]
             if not offline:
                 remote_branches = [f"Remote: {ref.name.replace('origin/', '')}" for ref in git_wrapper.get_origin_refs() if ref.name != 'origin/HEAD']
                 branches = local_branches + remote_branches
@@ -1184,7 +1197,7 @@ def checkout(
                 target = branch_name
 
         # Check if target is a branch
-        if target in git_wrapper.get_branches() or (not offline and target.startswith("origin/")):
+        if git_wrapper.has_local_branch(target) or (not offline and target.startswith("origin/")):
             # Check if there are uncommitted changes
             if git_wrapper.is_dirty(untracked_files=True) and not force:
                 action = inquirer.select(
@@ -1208,7 +1221,7 @@ def checkout(
                 if not offline and target.startswith("origin/"):
                     # For remote branches, create a new local branch
                     local_branch_name = target.split("/", 1)[1]
-                    if local_branch_name not in git_wrapper.get_branches():
+                    if not git_wrapper.has_local_branch(local_branch_name):
                         git_wrapper.checkout(local_branch_name, target, create=True)
                     else:
                         git_wrapper.checkout(local_branch_name)
@@ -1265,10 +1278,9 @@ def rm(
 
     if git_wrapper.check_network_connection():
         # Update local and remote references
-        git_wrapper.fetch('--all')
-        git_wrapper.remote('prune', 'origin')
+        git_wrapper.fetch(all_remotes=True, prune=True)
 
-    local_branches = [head.name for head in git_wrapper.get_repo_heads() if head.name not in ['develop', 'main']]
+    local_branches = [name for name in git_wrapper.get_local_branches() if name not in ['develop', 'main']]
     remote_branches = []
     if git_wrapper.check_network_connection():
         remote_branches = [ref.name.replace('origin/', '') for ref in git_wrapper.get_origin_refs()
@@ -1304,8 +1316,9 @@ def rm(
     else:
         selected_branches = branch_names
 
-    # Process selected branches
+    # Process selected branches, grouped by what has to be deleted so each group runs in one batch
     processed_branches = set()  # Keep track of processed branches
+    deletions = {}
     for branch in selected_branches:
         if "Local: " in branch:
             branch_name = branch.replace("Local: ", "")
@@ -1321,12 +1334,15 @@ def rm(
 
         # When using -a, always try to delete both local and remote
         if all:
-            git_wrapper.delete_branch(branch_name, delete_remote=True, delete_local=True)
+            deletions.setdefault((True, True), []).append(branch_name)
         else:
             # Otherwise, only delete what was selected
             delete_local = any(f"Local: {branch_name}" in b for b in selected_branches)
             delete_remote = any(f"Remote: {branch_name}" in b for b in selected_branches)
-            git_wrapper.delete_branch(branch_name, delete_remote=delete_remote, delete_local=delete_local)
+            deletions.setdefault((delete_remote, delete_local), []).append(branch_name)
+
+    for (delete_remote, delete_local), names in deletions.items():
+        git_wrapper.delete_branches(names, delete_remote=delete_remote, delete_local=delete_local)
 
     # Switch to develop branch if current branch was deleted
     if git_wrapper.get_current_branch() not in local_branches + ['develop', 'main']:
@@ -1381,10 +1397,9 @@ def mv(
     offline = not git_wrapper.check_network_connection()
 
     if not offline:
-        git_wrapper.fetch('--all')
-        git_wrapper.remote('prune', 'origin')
+        git_wrapper.fetch(all_remotes=True, prune=True)
 
-    local_branches = [head.name for head in git_wrapper.get_repo_heads()]
+    local_branches = git_wrapper.get_local_branches()
     remote_branches = []
     if not offline:
         remote_branches = [ref.name.replace('origin/', '') for ref in git_wrapper.get_origin_refs() if ref.name != 'origin/HEAD']
@@ -2210,6 +2225,7 @@ def explain(
             prompt += f"\n\nAdditional instructions: \n{custom_prompt}"
 
         # Use the AI client to generate the explanation
+        from client import AIClient, GitConfig
         ai_client = AIClient(config_provider=GitConfig())
         current_provider = ai_client.get_current_provider_name()
 
@@ -2932,9 +2948,7 @@ def push(
             changes_made = False
             try:
                 print(f"[blue]Checking differences between {branch} and origin/{branch}[/blue]")
-                ahead_behind = git_wrapper.rev_list('--left-right', '--count', f'origin/{branch}...HEAD').split()
-                behind = int(ahead_behind[0])
-                ahead = int(ahead_behind[1])
+                ahead, behind = ahead_behind_remote(branch)
 
                 if ahead > 0:
                     console.print(f"[yellow]Your local branch is {ahead} commit(s) ahead of the remote branch.[/yellow]")
@@ -3176,9 +3190,7 @@ def status():
 
         # Get ahead/behind info
         try:
-            ahead_behind = git_wrapper.rev_list('--left-right', '--count', f'origin/{current_branch}...HEAD').split()
-            behind = int(ahead_behind[0])
-            ahead = int(ahead_behind[1])
+            ahead, behind = ahead_behind_remote(current_branch)
             status_table.add_row("Commits Ahead/Behind", f"Ahead by {ahead}, Behind by {behind}")
         except GitCommandError:
             status_table.add_row("Commits Ahead/Behind", "Unable to determine")
@@ -3300,7 +3312,7 @@ def cp(
 
         # If target_branches is not provided, show a list of branches to select from
         if not target_branches:
-            branches = [head.name for head in git_wrapper.get_heads() if head.name != git_wrapper.get_current_branch()]
+            branches = [name for name in git_wrapper.get_local_branches() if name != original_branch]
             target_branches = inquirer.checkbox(
                 message="Select branch(es) to copy into:",
                 choices=branches
@@ -3812,6 +3824,8 @@ def issue_doc(
     include_comments: bool = typer.Option(False, "-c", "--comments", help="Include issue comments")
 ):
     """Generate documentation from GitHub issues."""
+    # python-docx, markdown and BeautifulSoup are only loaded for this command
+    from client.issuedoc import IssueDocGenerator
     doc_generator = IssueDocGenerator()
     doc = doc_generator.generate_doc(issue_number, max_depth, max_issues, include_comments)
     doc.save(output)
@@ -4052,6 +4066,7 @@ def doc(
     This command generates documentation for the script, including an optional
     table of contents and custom title.
     """
+    from client import DocGenerator
     result = DocGenerator.generate_doc(__file__, title, toc)
     print(result)
 